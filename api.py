@@ -0,0 +1,227 @@
+"""
+JSON API served by the same process as the NiceGUI page.
+
+NiceGUI runs on FastAPI, so the routes are added to its ``app`` and share the
+front end's tier catalogs, solution cache and solver pool. Importing this
+module registers them:
+
+* ``POST /api/optimize`` solves one spending profile.
+* ``POST /api/optimize/batch`` solves many profiles with ``optimize_batch``.
+* ``GET /api/metrics`` reports request latencies and the shared caches' and
+  pool's counters.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Annotated, Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException, Request
+from nicegui import app
+from pydantic import BaseModel, Field
+
+from app_state import solutions, solver_pool, tier_catalogs
+from catalog_cache import SCORE_TIERS
+from solver import optimize_batch
+from solver_pool import SolverBusy
+
+# largest number of profiles accepted by one batch request
+API_MAX_BATCH = int(os.environ.get("API_MAX_BATCH", "1000"))
+
+# score used when a request gives only its tier, as the front end does
+DEFAULT_SCORE = 800
+
+
+class Profile(BaseModel):
+    """
+    One spending profile.
+    """
+
+    spending: Dict[str, Annotated[float, Field(ge=0)]] = Field(description="Annual spending by category.")
+    tier: str = Field(description=f"Credit score tier, one of {SCORE_TIERS}.")
+    score: int = Field(DEFAULT_SCORE, description="Credit score, checked against each card's minimum.")
+
+
+class BatchRequest(BaseModel):
+    """
+    Profiles to solve in one request.
+    """
+
+    profiles: List[Profile]
+
+
+class Solution(BaseModel):
+    """
+    Optimal wallet for one profile, as returned by ``optimize_cardspace``.
+    """
+
+    chosen: Dict[str, Optional[str]]
+    total: float
+    held: List[str]
+    breakdown: Dict[str, dict]
+    version: str
+
+
+class RequestMetrics:
+    """
+    Latency of recent API requests per route.
+
+    Parameters
+    ----------
+    window : int
+        Number of most recent requests per route kept for the percentiles.
+    """
+
+    def __init__(self, window=10000):
+        self.window = window
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def record(self, route, seconds, ok):
+        """
+        Record one finished request.
+
+        Parameters
+        ----------
+        route : str
+            Route path, e.g. "/api/optimize".
+        seconds : float
+            Wall-clock time from receiving the request to sending the response.
+        ok : bool
+            Whether the response had a non-error status.
+        """
+        with self._lock:
+            route_stats = self._routes.setdefault(
+                route, {"requests": 0, "errors": 0, "latencies": deque(maxlen=self.window)}
+            )
+            route_stats["requests"] += 1
+            route_stats["errors"] += not ok
+            route_stats["latencies"].append(seconds)
+
+    def stats(self):
+        """
+        Counters and latency percentiles per route.
+
+        Returns
+        -------
+        dict
+            Route -> ``requests`` and ``errors`` since startup, plus ``mean``,
+            ``p50``, ``p95``, ``p99`` and ``max`` seconds over the window.
+        """
+        with self._lock:
+            routes = {route: (s["requests"], s["errors"], np.array(s["latencies"])) for route, s in self._routes.items()}
+        out = {}
+        for route, (requests, errors, latencies) in routes.items():
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            out[route] = {
+                "requests": requests,
+                "errors": errors,
+                "mean": float(latencies.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(latencies.max()),
+            }
+        return out
+
+
+metrics = RequestMetrics()
+
+
+@app.middleware("http")
+async def time_api_requests(request: Request, call_next):
+    if not request.url.path.startswith("/api/"):
+        return await call_next(request)
+    start = time.perf_counter()
+    response = await call_next(request)
+    metrics.record(request.url.path, time.perf_counter() - start, response.status_code < 400)
+    return response
+
+
+def check_tier(tier):
+    if tier not in SCORE_TIERS:
+        raise HTTPException(422, f"unknown tier {tier!r}, expected one of {SCORE_TIERS}")
+
+
+def solution(chosen, total, held, breakdown, version):
+    return Solution(chosen=chosen, total=float(total), held=sorted(held), breakdown=breakdown, version=version)
+
+
+async def run_solver(fn, *args):
+    # the pool's back-pressure and timeout map to the usual gateway statuses
+    try:
+        return await solver_pool.run(fn, *args)
+    except SolverBusy as e:
+        raise HTTPException(503, str(e), headers={"Retry-After": "1"})
+    except TimeoutError:
+        raise HTTPException(504, "solve timed out")
+
+
+@app.post("/api/optimize", response_model=Solution)
+async def optimize(profile: Profile):
+    """
+    Optimal wallet for one spending profile.
+
+    Goes through the same solution cache as the page, keyed by the catalog
+    version the answer was computed from.
+    """
+    check_tier(profile.tier)
+    catalog = tier_catalogs.get(profile.tier)
+    version = tier_catalogs.version
+    result = await run_solver(
+        solutions.solve, catalog, profile.spending, profile.score, profile.tier, version,
+    )
+    if result[0] is None:
+        # a failed solve returns (None, 0.0, set(), {}, {})
+        raise HTTPException(422, "no optimal wallet found for this profile")
+    chosen, total, held, breakdown = result
+    return solution(chosen, total, held, breakdown, version)
+
+
+@app.post("/api/optimize/batch", response_model=List[Solution])
+async def optimize_many(batch: BatchRequest):
+    """
+    Optimal wallets for many spending profiles, in request order.
+
+    Profiles are grouped by tier and each group is solved with one
+    ``optimize_batch`` call in the solver pool.
+    """
+    if len(batch.profiles) > API_MAX_BATCH:
+        raise HTTPException(413, f"at most {API_MAX_BATCH} profiles per request")
+    by_tier = {}
+    for i, profile in enumerate(batch.profiles):
+        check_tier(profile.tier)
+        by_tier.setdefault(profile.tier, []).append(i)
+
+    results = [None] * len(batch.profiles)
+    for tier, rows in by_tier.items():
+        catalog = tier_catalogs.get(tier)
+        version = tier_catalogs.version
+        frame = await run_solver(
+            optimize_batch, catalog, None,
+            [batch.profiles[i].spending for i in rows], [batch.profiles[i].score for i in rows],
+        )
+        for i, row in zip(rows, frame.itertuples(index=False)):
+            if row.chosen is None:
+                raise HTTPException(422, f"no optimal wallet found for profile {i}")
+            # the batch fills categories another profile spends on with zero
+            cats = batch.profiles[i].spending
+            chosen = {k: v for k, v in row.chosen.items() if k in cats}
+            breakdown = {k: v for k, v in row.breakdown.items() if k in cats}
+            results[i] = solution(chosen, row.total, row.held, breakdown, version)
+    return results
+
+
+@app.get("/api/metrics")
+async def api_metrics():
+    """
+    Request latencies and the shared caches' and solver pool's counters.
+    """
+    return {
+        "requests": metrics.stats(),
+        "solver_pool": solver_pool.stats(),
+        "solutions": solutions.stats(),
+        "catalog": tier_catalogs.stats(),
+    }
@@ -0,0 +1,35 @@
+"""
+Process-wide state shared by every client of the front end.
+
+NiceGUI re-executes ``front_end.py`` for each client connection, while
+imported modules are only loaded once per process. Caches and the solver
+pool therefore live here so all clients share them.
+"""
+
+import os
+
+from nicegui import app
+
+from catalog_cache import TierCatalogCache
+from result_cache import SolutionCache
+from solver_pool import SolverPool
+from startup_profile import phase, report
+
+CATALOG_PATH = os.environ.get("CATALOG_PATH", "cards_w_score.json")
+
+# solver pool settings, overridable from the environment
+SOLVER_WORKERS = int(os.environ.get("SOLVER_WORKERS", "4"))
+SOLVER_MAX_PENDING = int(os.environ.get("SOLVER_MAX_PENDING", "32"))
+SOLVER_TIMEOUT = float(os.environ.get("SOLVER_TIMEOUT", "30"))
+
+# one compiled catalog per score tier, rebuilt only when the file changes
+with phase("load catalog"):
+    tier_catalogs = TierCatalogCache(CATALOG_PATH)
+
+# memoized solutions keyed by spending, score tier, eligible cards and catalog version
+solutions = SolutionCache(maxsize=4096, ttl=24 * 60 * 60)
+
+# solves run here so a slow CBC call never blocks the event loop
+solver_pool = SolverPool(SOLVER_WORKERS, SOLVER_MAX_PENDING, SOLVER_TIMEOUT)
+app.on_shutdown(lambda: solver_pool.shutdown(wait=False))
+app.on_startup(lambda: print(report()))
@@ -0,0 +1,76 @@
+"""
+Scaling of cleaners.clean_catalog with the number of worker processes.
+
+Builds a synthetic corpus of about 100k raw reward strings by resampling the
+cards in clean_cards.json and randomizing every number in their reward text
+(so the category memo doesn't turn the run into cache hits), then times
+clean_catalog at 1, 2, 4, ... workers up to the CPU count.
+
+    python benchmarks/clean_scaling.py [--strings 100000] [--max-workers N]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cleaners import clean_catalog  # noqa: E402
+
+
+def synthetic_corpus(path, strings, seed=0):
+    """
+    Resample cards from a cleaned catalog into a raw corpus of about ``strings`` reward strings.
+    """
+    rng = random.Random(seed)
+    cards = pd.read_json(path)[["name", "issuer", "annual_fee", "rewards"]].to_dict("records")
+    per_card = sum(len(c["rewards"]) for c in cards) / len(cards)
+
+    def jitter(text):
+        return re.sub(r"\d+(?:\.\d+)?", lambda m: f"{rng.uniform(1, 10):.{rng.choice([0, 1, 2])}f}", text)
+
+    rows = []
+    for i in range(int(strings / per_card)):
+        card = rng.choice(cards)
+        rows.append({
+            "name": f"{card['name']} {i}",
+            "issuer": card["issuer"],
+            "annual_fee": card["annual_fee"],
+            "rewards": [jitter(r) for r in card["rewards"]],
+        })
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--catalog", default=os.path.join(os.path.dirname(__file__), "..", "clean_cards.json"))
+    parser.add_argument("--strings", type=int, default=100_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    df = synthetic_corpus(args.catalog, args.strings)
+    total = int(df["rewards"].str.len().sum())
+    print(f"{len(df)} cards, {total} reward strings, {os.cpu_count()} CPUs")
+
+    workers = [1]
+    while workers[-1] * 2 <= args.max_workers:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != args.max_workers:
+        workers.append(args.max_workers)
+
+    baseline = None
+    for n in workers:
+        start = time.perf_counter()
+        clean_catalog(df, workers=n)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"workers={n:<3} {seconds:7.2f}s  {total / seconds:9.0f} strings/s  speedup {baseline / seconds:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
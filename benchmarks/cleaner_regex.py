@@ -0,0 +1,87 @@
+"""
+Cost of the cleaners' regexes: precompiled patterns against re's module functions.
+
+For every pattern in cleaners.patterns, runs search over all scraped reward
+strings three ways:
+- with the compiled object;
+- through re.search with the pattern string, which goes through re's
+  internal cache as the old inline patterns did;
+- the same, with re.purge() before every pass, so every pattern is
+  recompiled as when the cache evicted them.
+
+It then times each cleaner's clean_rate over the strings it cleans.
+
+    python benchmarks/cleaner_regex.py [--repeat 30]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cleaners import cleaner_for, patterns  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def reward_strings():
+    """
+    Distinct (issuer, reward string) pairs from both catalogs.
+    """
+    pairs = set()
+    for name in ("clean_cards.json", "cards_w_score.json"):
+        df = pd.read_json(os.path.join(ROOT, name))
+        for issuer, rewards in zip(df["issuer"], df["rewards"]):
+            pairs.update((issuer, r) for r in rewards)
+    return sorted(pairs)
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    pairs = reward_strings()
+    texts = [text for _, text in pairs]
+    compiled = {name: value for name, value in vars(patterns).items() if isinstance(value, re.Pattern)}
+    print(f"{len(texts)} reward strings, {len(compiled)} patterns, {args.repeat} passes")
+
+    def precompiled():
+        for pattern in compiled.values():
+            for text in texts:
+                pattern.search(text)
+
+    def module_cached():
+        for pattern in compiled.values():
+            for text in texts:
+                re.search(pattern.pattern, text, pattern.flags)
+
+    def module_cold():
+        re.purge()
+        module_cached()
+
+    for label, fn in [("precompiled", precompiled), ("re.search", module_cached), ("re.search cold", module_cold)]:
+        print(f"{label:<16} {timed(fn, args.repeat):6.2f}s")
+
+    by_cleaner = {}
+    for issuer, text in pairs:
+        by_cleaner.setdefault(cleaner_for(issuer), []).append(text)
+    for cleaner, strings in by_cleaner.items():
+        seconds = timed(lambda: [cleaner.clean_rate(s) for s in strings], args.repeat)
+        print(f"{cleaner.__name__.rsplit('.', 1)[-1]:<20} clean_rate {len(strings):5} strings {seconds:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Full-page versus scoped parsing of a saved listing page.
+
+Builds a listing of ``--cards`` cards from the saved Chase fixture by
+repeating its card containers, plus navigation and footer filler of the kind
+real issuer pages carry. It then times scraper_core.parse on the whole page
+and with the scraper's scope() strainer, for every installed parser. Pass
+``--page`` and ``--selector`` to time a page saved from a live site instead.
+
+    python benchmarks/parse_scoped.py [--cards 30] [--repeat 20] [--page PATH --selector SELECTOR]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scrapers import scraper_core  # noqa: E402
+from scrapers.chase_scraper import CARD_SELECTOR  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "chase", "all-credit-cards.html")
+
+
+def synthetic_listing(cards, filler=400):
+    """
+    The saved Chase listing grown to ``cards`` card containers and ``filler`` navigation links.
+    """
+    with open(FIXTURE, encoding="utf-8") as f:
+        html = f.read().replace("{base}", "https://creditcards.chase.com")
+    blocks = re.findall(r'<div class="cmp-cardsummary">.*?\n  </div>\n', html, flags=re.S)
+    body = "".join(blocks[i % len(blocks)] for i in range(cards))
+    nav = "".join(f'<li class="nav-item"><a href="/page/{i}"><span>Link {i}</span></a></li>' for i in range(filler))
+    footer = "".join(f'<p class="legal">Disclosure {i}: terms and conditions apply.</p>' for i in range(filler))
+    return f"<html><body><header><ul>{nav}</ul></header><main>{body}</main><footer>{footer}</footer></body></html>"
+
+
+def available_parsers():
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--page", default=None, help="saved HTML page to parse instead of the synthetic listing")
+    parser.add_argument("--selector", default=CARD_SELECTOR, help="root selector to scope the parse to")
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, encoding="utf-8") as f:
+            html = f.read()
+    else:
+        html = synthetic_listing(args.cards)
+    strainer = scraper_core.scope(args.selector)
+    print(f"{len(html) / 1024:.0f} KiB page, selector {args.selector!r}, {args.repeat} parses each")
+
+    for name in available_parsers():
+        scraper_core.PARSER = name
+        found = len(scraper_core.parse(html, strainer).select(args.selector))
+        for label, parse_only in [("full", None), ("scoped", strainer)]:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                scraper_core.parse(html, parse_only)
+            seconds = time.perf_counter() - start
+            print(f"{name:<12} {label:<7} {seconds:6.2f}s  ({found} containers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Per-score-tier cache of compiled card catalogs.
+
+The front end filters the card catalog by the user's credit score tier and
+hands the result to the solver. Compiling those tier catalogs is done once
+here and reused until the catalog file changes on disk.
+"""
+
+import os
+import threading
+
+from catalog_store import open_store
+from solver import CardCatalog
+
+SCORE_TIERS = ["Excellent", "Very Good", "Good", "Fair", "Poor"]
+
+
+class TierCatalogCache:
+    """
+    Compiled ``CardCatalog`` per score tier, invalidated when the catalog
+    file changes.
+
+    Every lookup stats the file. If its mtime or size moved, the binary
+    store next to it is rebuilt unless it was built from that exact stat
+    (see ``catalog_store.open_store``), and when the content hash differs
+    every tier is reloaded from the memory-mapped arrays.
+
+    Parameters
+    ----------
+    path : str
+        Path to the cleaned catalog JSON (``cards_w_score.json``).
+    tiers : list
+        Score tiers to compile.
+    """
+
+    def __init__(self, path="cards_w_score.json", tiers=SCORE_TIERS):
+        self.path = path
+        self.tiers = list(tiers)
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.version = None
+        self.store = None
+        self._stat = None
+        self._catalogs = {}
+        self._lock = threading.Lock()
+        self._reload()
+
+    def _file_stat(self):
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def _reload(self):
+        self._stat = self._file_stat()
+        store = open_store(self.path, self.tiers)
+        if store.version == self.version:
+            return False
+
+        self.store = store
+        self._catalogs = {tier: store.catalog(tier) for tier in self.tiers}
+        self.version = store.version
+        self.reloads += 1
+        return True
+
+    def get(self, tier):
+        """
+        Return the compiled catalog for a score tier.
+
+        Parameters
+        ----------
+        tier : str
+            Score tier, e.g. "Excellent". Unknown tiers get an empty catalog.
+
+        Returns
+        -------
+        CardCatalog
+            Catalog of the cards whose typical score matches ``tier``.
+        """
+        with self._lock:
+            reloaded = self._file_stat() != self._stat and self._reload()
+            if reloaded:
+                self.misses += 1
+            else:
+                self.hits += 1
+            catalog = self._catalogs.get(tier)
+            if catalog is None:
+                catalog = CardCatalog([], [], [], [])
+            return catalog
+
+    def stats(self):
+        """
+        Cache counters and the current catalog version.
+
+        Returns
+        -------
+        dict
+            ``hits``, ``misses``, ``reloads`` and ``version`` (SHA-256 of the
+            catalog file).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "version": self.version,
+        }
@@ -0,0 +1,407 @@
+"""
+Binary, memory-mapped form of the cleaned card catalog.
+
+``cards_w_score.json`` has to be parsed in full by every process that reads
+it, and the solver then compiles a rate matrix per score tier on top. The
+store is built once from the JSON into an uncompressed ``.npz``. It holds:
+
+* a single UTF-8 string table that every text field points into by code,
+* the per-card display columns (name, issuer, fee text, reward text, score),
+* the cleaned rewards in long format, and
+* each score tier's compiled ``CardCatalog`` arrays.
+
+The arrays are memory-mapped straight out of the archive, so opening the
+store costs no parsing, and the pages are shared between all workers on a
+machine instead of being copied into each one.
+
+Build it explicitly with ``python catalog_store.py cards_w_score.json`` or
+let ``open_store`` rebuild it whenever the JSON's mtime or size differs from
+the ones the store was built from.
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+from solver import CardCatalog, compile_catalog
+
+TEXT_COLUMNS = ["name", "issuer", "annual_fee", "score"]
+
+
+def store_path(source):
+    """
+    Path of the store built from a catalog JSON file.
+
+    Parameters
+    ----------
+    source : str
+        Path to the cleaned catalog JSON.
+
+    Returns
+    -------
+    str
+        The same path with a ``.npz`` extension.
+    """
+    return os.path.splitext(source)[0] + ".npz"
+
+
+def build_store(source, tiers, target=None):
+    """
+    Compile a cleaned catalog JSON file into a store.
+
+    Parameters
+    ----------
+    source : str
+        Path to the cleaned catalog JSON (e.g. ``cards_w_score.json``).
+    tiers : list
+        Score tiers to compile a ``CardCatalog`` for.
+    target : str, optional
+        Output path. Defaults to ``store_path(source)``.
+
+    Returns
+    -------
+    str
+        Path of the written store.
+    """
+    import pandas as pd
+
+    target = target or store_path(source)
+    # taken before reading, so a write during the build leaves it stale
+    st = os.stat(source)
+    with open(source, "rb") as f:
+        version = hashlib.sha256(f.read()).hexdigest()
+    df = pd.read_json(source)
+
+    strings = {}
+
+    def codes(values):
+        return np.array([-1 if v is None else strings.setdefault(v, len(strings)) for v in values], dtype=np.int32)
+
+    arrays = {
+        "version": codes([version]),
+        "source_stat": np.array([st.st_mtime_ns, st.st_size], dtype=np.int64),
+        "tiers": codes(tiers),
+    }
+    for column in TEXT_COLUMNS:
+        values = df[column] if column in df else [None] * len(df)
+        arrays[column] = codes([None if pd.isna(v) else str(v) for v in values])
+    arrays["clean_annual_fee"] = df["clean_annual_fee"].to_numpy(dtype=np.float64)
+
+    # ragged columns as a flat array plus per-card start offsets
+    rewards = [list(r) if isinstance(r, list) else [] for r in df["rewards"]]
+    arrays["rewards"] = codes([r for card in rewards for r in card])
+    arrays["rewards_start"] = np.cumsum([0] + [len(card) for card in rewards], dtype=np.int64)
+
+    clean = [list(r) if isinstance(r, list) else [] for r in df["clean_rewards"]]
+    entries = [e for card in clean for e in card]
+    arrays["clean_start"] = np.cumsum([0] + [len(card) for card in clean], dtype=np.int64)
+    arrays["clean_value"] = np.array([e[0] for e in entries], dtype=np.float64)
+    for field, position in [("clean_type", 1), ("clean_unit", 2), ("clean_category", 3)]:
+        arrays[field] = codes([e[position] for e in entries])
+
+    score = df["score"] if "score" in df else pd.Series([None] * len(df))
+    for k, tier in enumerate(tiers):
+        rows = np.flatnonzero((score == tier).to_numpy())
+        catalog = compile_catalog(df.iloc[rows])
+        # compile_catalog keeps the last listing of a repeated name
+        last = {name: row for row, name in zip(rows, df["name"].iloc[rows])}
+        arrays[f"tier{k}_cards"] = np.array([last[name] for name in catalog.names], dtype=np.int32)
+        arrays[f"tier{k}_categories"] = codes(catalog.categories)
+        arrays[f"tier{k}_rates"] = catalog.rates
+        arrays[f"tier{k}_fees"] = catalog.fees
+        arrays[f"tier{k}_min_scores"] = catalog.min_scores
+        arrays[f"tier{k}_triggers"] = np.array(catalog.triggers, dtype=np.float64).reshape(-1, 4)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    arrays["strings"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    arrays["strings_start"] = np.cumsum([0] + [len(s) for s in encoded], dtype=np.int64)
+
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, target)
+    return target
+
+
+def mmap_npz(path):
+    """
+    Memory-map every array of an uncompressed ``.npz`` in place.
+
+    ``np.load`` ignores ``mmap_mode`` for archives, so each member's offset
+    is read from its zip header and mapped directly.
+
+    Parameters
+    ----------
+    path : str
+        Path to an ``.npz`` written by ``np.savez``.
+
+    Returns
+    -------
+    dict
+        Mapping array name -> read-only ``np.memmap``.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: {info.filename} is compressed and can't be memory-mapped")
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+
+            major, _ = np.lib.format.read_magic(f)
+            read_header = np.lib.format.read_array_header_1_0 if major == 1 else np.lib.format.read_array_header_2_0
+            shape, fortran_order, dtype = read_header(f)
+
+            name = info.filename[:-len(".npy")]
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", shape=shape, offset=f.tell(),
+                                         order="F" if fortran_order else "C")
+    return arrays
+
+
+class CatalogStore:
+    """
+    Read-only view of a store file.
+
+    Parameters
+    ----------
+    path : str
+        Path to a store written by ``build_store``.
+
+    Attributes
+    ----------
+    version : str
+        SHA-256 of the JSON file the store was built from.
+    source_stat : tuple or None
+        ``(st_mtime_ns, st_size)`` of that file when it was read; None for
+        a store written before this was recorded.
+    tiers : list
+        Score tiers with a compiled catalog.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.arrays = mmap_npz(path)
+        self._strings = self.arrays["strings"]
+        self._starts = self.arrays["strings_start"]
+        self.version = self.string(self.arrays["version"][0])
+        source_stat = self.arrays.get("source_stat")
+        self.source_stat = None if source_stat is None else tuple(int(v) for v in source_stat)
+        self.tiers = self.strings(self.arrays["tiers"])
+        self._records = None
+        self._options = {}
+        self._names = None
+
+    def __len__(self):
+        return len(self.arrays["name"])
+
+    def string(self, code):
+        """
+        Decode one entry of the string table.
+
+        Parameters
+        ----------
+        code : int
+            Index into the string table, or -1 for a missing value.
+
+        Returns
+        -------
+        str
+            The string, or None for -1.
+        """
+        if code < 0:
+            return None
+        return self._strings[self._starts[code]:self._starts[code + 1]].tobytes().decode("utf-8")
+
+    def strings(self, codes):
+        """
+        Decode a sequence of string codes.
+
+        Parameters
+        ----------
+        codes : array-like
+            Indices into the string table.
+
+        Returns
+        -------
+        list
+            The decoded strings.
+        """
+        return [self.string(code) for code in codes]
+
+    def card(self, i):
+        """
+        One card in the same record form as ``cards_w_score.json``.
+
+        Parameters
+        ----------
+        i : int
+            Row of the card.
+
+        Returns
+        -------
+        dict
+            Display text, score and cleaned fee and rewards of the card.
+        """
+        a = self.arrays
+        rewards = slice(a["rewards_start"][i], a["rewards_start"][i + 1])
+        clean = slice(a["clean_start"][i], a["clean_start"][i + 1])
+        record = {column: self.string(a[column][i]) for column in TEXT_COLUMNS}
+        record["rewards"] = self.strings(a["rewards"][rewards])
+        record["clean_annual_fee"] = float(a["clean_annual_fee"][i])
+        record["clean_rewards"] = [
+            [float(value), self.string(t), self.string(u), self.string(c)]
+            for value, t, u, c in zip(a["clean_value"][clean], a["clean_type"][clean],
+                                      a["clean_unit"][clean], a["clean_category"][clean])
+        ]
+        return record
+
+    def records(self):
+        """
+        Every card as a record, decoded once per store.
+
+        Returns
+        -------
+        list
+            ``card(i)`` for every row.
+        """
+        if self._records is None:
+            self._records = [self.card(i) for i in range(len(self))]
+        return self._records
+
+    def options(self, column):
+        """
+        Distinct values of a text column.
+
+        Parameters
+        ----------
+        column : str
+            One of ``TEXT_COLUMNS``, e.g. "issuer".
+
+        Returns
+        -------
+        dict
+            Value -> string code, sorted by value. Missing values are left out.
+        """
+        if column not in self._options:
+            codes = np.unique(self.arrays[column])
+            values = {self.string(code): int(code) for code in codes if code >= 0}
+            self._options[column] = dict(sorted(values.items()))
+        return self._options[column]
+
+    def search(self, text=None, issuer=None, max_fee=None, score=None):
+        """
+        Rows of the cards matching every given filter, without decoding the
+        cards themselves.
+
+        Parameters
+        ----------
+        text : str, optional
+            Case-insensitive substring of the card name.
+        issuer : str, optional
+            Exact issuer.
+        max_fee : float, optional
+            Highest cleaned annual fee.
+        score : str, optional
+            Exact typical score tier.
+
+        Returns
+        -------
+        np.ndarray
+            Matching rows, ordered by issuer and then catalog order.
+        """
+        a = self.arrays
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in [("issuer", issuer), ("score", score)]:
+            if value is not None:
+                mask &= a[column] == self.options(column).get(value, -2)
+        if max_fee is not None:
+            mask &= a["clean_annual_fee"] <= max_fee
+        if text:
+            if self._names is None:
+                self._names = [name.casefold() for name in self.strings(a["name"])]
+            needle = text.casefold()
+            mask &= np.array([needle in name for name in self._names], dtype=bool)
+
+        rows = np.flatnonzero(mask)
+        rank = {code: k for k, code in enumerate(self.options("issuer").values())}
+        order = np.argsort([rank.get(code, len(rank)) for code in a["issuer"][rows]], kind="stable")
+        return rows[order]
+
+    def catalog(self, tier):
+        """
+        The compiled catalog of a score tier, backed by the mapped arrays.
+
+        Parameters
+        ----------
+        tier : str
+            Score tier, e.g. "Excellent".
+
+        Returns
+        -------
+        CardCatalog
+            Same catalog ``compile_catalog`` builds for the tier; unknown
+            tiers get an empty one.
+        """
+        if tier not in self.tiers:
+            return CardCatalog([], [], [], [])
+        k = self.tiers.index(tier)
+        a = self.arrays
+        triggers = [(int(row), int(col), min_spend, bonus) for row, col, min_spend, bonus in a[f"tier{k}_triggers"]]
+        return CardCatalog(
+            self.strings(a["name"][a[f"tier{k}_cards"]]),
+            self.strings(a[f"tier{k}_categories"]),
+            a[f"tier{k}_rates"],
+            a[f"tier{k}_fees"],
+            a[f"tier{k}_min_scores"],
+            triggers,
+        )
+
+
+def open_store(source, tiers):
+    """
+    Open the store for a catalog JSON file, rebuilding it if the JSON's
+    mtime or size is not the one the store was built from, or the tiers
+    differ.
+
+    Comparing against the recorded stat rather than the store's own mtime
+    also catches a JSON replaced by content with an older mtime
+    (``cp -p``, ``rsync -a``, ``tar x``).
+
+    Parameters
+    ----------
+    source : str
+        Path to the cleaned catalog JSON.
+    tiers : list
+        Score tiers the store must have compiled.
+
+    Returns
+    -------
+    CatalogStore
+        The up-to-date store.
+    """
+    target = store_path(source)
+    if os.path.exists(target):
+        store = CatalogStore(target)
+        st = os.stat(source)
+        if store.source_stat == (st.st_mtime_ns, st.st_size) and store.tiers == list(tiers):
+            return store
+    build_store(source, tiers, target)
+    return CatalogStore(target)
+
+
+if __name__ == "__main__":
+    from catalog_cache import SCORE_TIERS
+
+    parser = argparse.ArgumentParser(description="Compile a cleaned catalog JSON into a memory-mappable store.")
+    parser.add_argument("source", nargs="?", default="cards_w_score.json")
+    parser.add_argument("--target", default=None)
+    args = parser.parse_args()
+    print(build_store(args.source, SCORE_TIERS, args.target))
@@ -0,0 +1,67 @@
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+import pandas as pd
+from cleaners import capital_one_cleaner, nerdwallet_cleaner
+
+# issuers scraped from their own site; everything else comes from NerdWallet
+CLEANERS = {"Capital One": capital_one_cleaner}
+
+
+def cleaner_for(issuer: str):
+    """
+    Picks the cleaner module whose rules match an issuer's scraped text.
+
+    Args:
+        issuer (str): The card issuer.
+
+    Returns:
+        module: capital_one_cleaner or nerdwallet_cleaner.
+    """
+    return CLEANERS.get(issuer, nerdwallet_cleaner)
+
+
+def clean_cards(cards: list) -> list:
+    """
+    Cleans a batch of cards with each card's issuer rules.
+
+    Args:
+        cards (list): (issuer, annual_fee, rewards) per card.
+
+    Returns:
+        list: (clean_annual_fee, clean_rewards) per card, in the same order.
+    """
+    cleaned = []
+    for issuer, annual_fee, rewards in cards:
+        cleaner = cleaner_for(issuer)
+        cleaned.append((cleaner.clean_annual_fee(annual_fee), cleaner.clean_rewards_list(rewards)))
+    return cleaned
+
+
+def clean_catalog(df: pd.DataFrame, workers: int = None, chunk_size: int = None) -> pd.DataFrame:
+    """
+    Adds clean_annual_fee and clean_rewards to a scraped catalog, cleaning chunks of cards in parallel processes.
+
+    Args:
+        df (pd.DataFrame): Scraped cards with issuer, annual_fee and rewards columns.
+        workers (int): Number of worker processes; 1 cleans in this process. Defaults to os.cpu_count().
+        chunk_size (int): Cards per task. Defaults to enough for about four tasks per worker.
+
+    Returns:
+        pd.DataFrame: A copy of df with the two cleaned columns, rows in their original order.
+    """
+    workers = workers or os.cpu_count() or 1
+    cards = list(zip(df["issuer"], df["annual_fee"], df["rewards"]))
+    chunk_size = chunk_size or max(1, math.ceil(len(cards) / (workers * 4)))
+    chunks = [cards[i:i + chunk_size] for i in range(0, len(cards), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        cleaned = [card for chunk in map(clean_cards, chunks) for card in chunk]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            cleaned = [card for chunk in executor.map(clean_cards, chunks) for card in chunk]
+
+    df = df.copy()
+    df["clean_annual_fee"] = [fee for fee, _ in cleaned]
+    df["clean_rewards"] = pd.Series([rewards for _, rewards in cleaned], index=df.index, dtype=object)
+    return df
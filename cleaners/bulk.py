@@ -0,0 +1,86 @@
+import pandas as pd
+
+from cleaners import cleaner_for
+
+COLUMNS = ["card_id", "value", "type", "unit", "category"]
+
+
+def explode_rewards(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Puts every raw reward string of every card into one column.
+
+    Args:
+        df (pd.DataFrame): Scraped cards with a rewards column of string lists.
+
+    Returns:
+        pd.DataFrame: One row per reward string, in card then list order, with card_id (the
+            position of the card in df, so repeated index labels stay apart) and text.
+    """
+    strings = df["rewards"].reset_index(drop=True).explode().dropna()
+    return pd.DataFrame({"card_id": strings.index, "text": strings.astype(str).to_numpy(dtype=object)})
+
+
+def clean_rewards_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cleans the rewards of every card into one long-format table.
+
+    Each card gets its issuer's rules (see cleaners.cleaner_for). Dumps repeat the same reward
+    text across many cards, so each distinct (cleaner, reward string) pair is cleaned once with
+    the cleaner's own clean_rewards_list and its rows are copied back to every occurrence.
+
+    Args:
+        df (pd.DataFrame): Scraped cards with issuer and rewards columns.
+
+    Returns:
+        pd.DataFrame: One row per reward with card_id (position of the card in df), value,
+            type, unit and category, in the order clean_rewards_list would list them.
+    """
+    strings = explode_rewards(df)
+    by_issuer = {issuer: cleaner_for(issuer) for issuer in df["issuer"].unique()}
+    cleaners = [by_issuer[issuer] for issuer in df["issuer"].to_numpy()[strings["card_id"].to_numpy(dtype=int)]]
+    codes, unique = pd.factorize(pd.Series(list(zip(cleaners, strings["text"])), dtype=object))
+    cleaned = [cleaner.clean_rewards_list([text]) for cleaner, text in unique]
+
+    rows = [(card_id, *reward) for card_id, code in zip(strings["card_id"], codes) for reward in cleaned[code]]
+    rewards = pd.DataFrame(rows, columns=COLUMNS)
+    rewards["value"] = rewards["value"].astype(float)
+    return rewards
+
+
+def clean_annual_fees(df: pd.DataFrame) -> pd.Series:
+    """
+    clean_annual_fee with each card's issuer rules, once per distinct (cleaner, fee string).
+
+    Args:
+        df (pd.DataFrame): Scraped cards with issuer and annual_fee columns.
+
+    Returns:
+        pd.Series: The annual fee of each card as an integer, indexed like df.
+
+    Raises:
+        ValueError: For a Capital One fee string clean_annual_fee can't read.
+    """
+    pairs = pd.Series(list(zip(df["issuer"].map(cleaner_for), df["annual_fee"].astype(str))), dtype=object)
+    codes, unique = pd.factorize(pairs)
+    fees = [cleaner.clean_annual_fee(fee) for cleaner, fee in unique]
+    return pd.Series([fees[code] for code in codes], index=df.index, name="clean_annual_fee", dtype=int)
+
+
+def rewards_lists(rewards: pd.DataFrame, index: pd.Index) -> pd.Series:
+    """
+    Folds a long rewards table back into the clean_rewards column format.
+
+    Args:
+        rewards (pd.DataFrame): Output of clean_rewards_table.
+        index (pd.Index): Index of the cleaned frame; card_id is a position in it. Cards without
+            rewards get [].
+
+    Returns:
+        pd.Series: A list of [value, type, unit, category] lists per card.
+    """
+    entries = pd.Series(
+        rewards[["value", "type", "unit", "category"]].to_numpy().tolist(),
+        index=rewards["card_id"], dtype=object,
+    )
+    lists = entries.groupby(level=0, sort=False).agg(list)
+    return pd.Series([lists.get(i, []) for i in range(len(index))], index=index, name="clean_rewards", dtype=object)
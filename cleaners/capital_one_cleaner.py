@@ -1,4 +1,9 @@
 import re
+from cleaners.categories import CATEGORIES, detect_category
+from cleaners.patterns import (
+    CLAUSE_AMOUNT_PATTERN, CLAUSE_SPLIT_PATTERN, DEPOSIT_AMOUNT_PATTERN, FLAT_AMOUNT_PATTERN,
+    GAS_DISCOUNT_PATTERN, NUMBER_PATTERN, PER_UNIT_PATTERN, RATE_PATTERN, TRAILING_NUMBER_PATTERN
+)
 
 units = [
     "miles",
@@ -22,14 +27,7 @@ types = {
 }
 
 
-categories = {
-    "Travel": ["chase travel", "capital one travel", "amex travel", "cititravel.com", "travel center", "amextravel.com", "capital one entertainment", "purchases on travel", "hotel", "flight", "vacation", "travel", "rental car", "rental cars", "flights", "air travel", "airlines", "airline", "delta purchases", "united purchases", "southwest airlines", "united purchases","hotel", "hotels", "lodging", "hyatt stays", "marriott bonvoy", "hilton portfolio", "ihg hotels & resorts", "vacation rental", "prepaid hotel bookings", "rental car", "rental cars", "transit", "taxis", "rideshare"],
-    "Groceries & Dining": ["dining", "restaurants", "takeout", "delivery services", "supermarkets", "grocery store", "grocery stores", "wholesale club", "wholesale clubs", "amazon fresh", "whole foods market", "uber eats", "grocery store", "dining", "food delivery", "restaurant", "entertainment", "streaming service"],
-    "Gas & Utilities": ["gas station", "gas stations", "ev charging station", "phone plans", "cable and streaming service"],
-    "Retail & Entertainment": ["entertainment", "drugstore", "drugstores", "online retail purchases", "online groceries", "online retail", "amazon.com", "partner merchants", "local transit", "online retail purchases", "T-Mobile", "REI", "Williams-Sonoma", "Pottery Barn", "West Elm", "Bass Pro Shops", "Cabela’s", "BJ’s", "Kohl’s", "streaming subscription", "streaming subscriptions", "select streaming services", "select streaming","popular streaming services"],
-    "All Purchases": ["all other", "every purchase", "all purchases", "everything else", "everywhere else", "other purchases", "eligible purchases", "all other eligible purchases", "on all purchases", "unlimited cash rewards", "all other", "every purchase", "all purchases", "everything else", "everywhere else", "anywhere", "business", "other purchases", "anywhere mastercard is accepted"],
-    "Caps & Limits": ["up to", "per year", "quarterly maximum", "then 1%", "first year", "after the first year", "combined purchases", "first year"]
-}
+categories = CATEGORIES
 
 FILTER_KEYWORDS = ["annual fee", "deposit", "credit line", "refundable", "initial credit line"]
 FILTER_PATTERN = re.compile(r"|".join(FILTER_KEYWORDS))
@@ -45,7 +43,7 @@ def clean_annual_fee(s):
         int: The cleaned annual fee as an integer.
     """
 
-    nums = re.findall(r"\d+", s)
+    nums = NUMBER_PATTERN.findall(s)
     if len(nums) == 1:
         return int(nums[0])
     elif "intro for the first year" in s:
@@ -53,21 +51,6 @@ def clean_annual_fee(s):
     else:
         raise ValueError
 
-def detect_category(clause_lower: str) -> str:
-    """
-    Detects the reward category based on keywords in the clause.
-
-    Args:
-        clause_lower (str): The reward clause in lowercase.
-    
-    Returns:
-        str: The detected reward category.
-    """
-    for cat, keywords in categories.items():
-        if any(k.lower() in clause_lower for k in keywords):
-            return cat
-    return "Other"
-
 def normalize_unit(unit: str) -> str:
     """
     Normalizes the unit string to a standard format.
@@ -96,22 +79,21 @@ def clean_rate(s: str) -> list[tuple]:
         list[tuple]: A list of tuples containing (value, rate_type, unit, category).
     """
 
-    pattern = r"(?<!\d\.)\b(?=\d+(?:\.\d+)?(?:X|%|\s+[a-zA-Z]))"
-    clauses = re.split(pattern, s)
-    clauses = [c.strip() for c in clauses if re.search(r"(\d|\$|¢)", c)]
+    clauses = CLAUSE_SPLIT_PATTERN.split(s)
+    clauses = [c.strip() for c in clauses if CLAUSE_AMOUNT_PATTERN.search(c)]
     
     results = []
 
     for clause in clauses:
         clause_lower = clause.lower()
 
-        m = re.search(r"(\d+(?:\.\d+)?)[¢c]?\s*off\/?(gallon|gal)", clause_lower)
+        m = GAS_DISCOUNT_PATTERN.search(clause_lower)
         if m:
             number, _ = m.groups()
             results.append((float(number), "Flat Amount", "cents off per gallon", "Gas"))
             continue
 
-        m_list = re.findall(r"(\d+(?:\.\d+)?)\s*([X%])\s*(?:in\s+)?([a-zA-Z\s]+)?", clause)
+        m_list = RATE_PATTERN.findall(clause)
         
         if m_list:
             for number_str, symbol, unit_str_or_none in m_list:
@@ -134,7 +116,7 @@ def clean_rate(s: str) -> list[tuple]:
             continue
 
         if "deposit" in clause_lower or "credit line" in clause_lower or "refundable" in clause_lower:
-            deposit_matches = re.findall(r"\$?(\d+(?:\.\d+)?)", clause_lower)
+            deposit_matches = DEPOSIT_AMOUNT_PATTERN.findall(clause_lower)
             if deposit_matches:
                 for val_str in set(deposit_matches):
                     val = float(val_str)
@@ -149,24 +131,18 @@ def clean_rate(s: str) -> list[tuple]:
                     results.append((val, "Flat Amount", unit_label, detect_category(clause_lower)))
             continue
 
-        m = re.search(
-            r"(\d+(?:\.\d+)?)\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s+per\s+([\w$]+)",
-            clause_lower
-        )
+        m = PER_UNIT_PATTERN.search(clause_lower)
         if m:
             number, unit, per_unit = m.groups()
             unit = normalize_unit(unit)
             results.append((float(number), "Per Unit", unit, detect_category(clause_lower)))
             continue
 
-        m = re.search(
-            r"(\d+(?:\.\d+)?)\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)",
-            clause_lower
-        )
+        m = FLAT_AMOUNT_PATTERN.search(clause_lower)
         if m:
             number, unit = m.groups()
             unit = normalize_unit(unit)
-            if float(number) > 1 and not re.search(r"(\s|\.)\d+$", clause_lower):
+            if float(number) > 1 and not TRAILING_NUMBER_PATTERN.search(clause_lower):
                  results.append((float(number), "Flat Amount", unit, detect_category(clause_lower)))
             continue
 
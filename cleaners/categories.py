@@ -0,0 +1,65 @@
+import re
+from functools import lru_cache
+
+CATEGORIES = {
+    "Travel": ["chase travel", "capital one travel", "amex travel", "cititravel.com", "travel center", "amextravel.com", "capital one entertainment", "purchases on travel", "hotel", "flight", "vacation", "travel", "rental car", "rental cars", "flights", "air travel", "airlines", "airline", "delta purchases", "united purchases", "southwest airlines", "united purchases","hotel", "hotels", "lodging", "hyatt stays", "marriott bonvoy", "hilton portfolio", "ihg hotels & resorts", "vacation rental", "prepaid hotel bookings", "rental car", "rental cars", "transit", "taxis", "rideshare"],
+    "Groceries & Dining": ["dining", "restaurants", "takeout", "delivery services", "supermarkets", "grocery store", "grocery stores", "wholesale club", "wholesale clubs", "amazon fresh", "whole foods market", "uber eats", "grocery store", "dining", "food delivery", "restaurant", "entertainment", "streaming service"],
+    "Gas & Utilities": ["gas station", "gas stations", "ev charging station", "phone plans", "cable and streaming service"],
+    "Retail & Entertainment": ["entertainment", "drugstore", "drugstores", "online retail purchases", "online groceries", "online retail", "amazon.com", "partner merchants", "local transit", "online retail purchases", "T-Mobile", "REI", "Williams-Sonoma", "Pottery Barn", "West Elm", "Bass Pro Shops", "Cabela’s", "BJ’s", "Kohl’s", "streaming subscription", "streaming subscriptions", "select streaming services", "select streaming","popular streaming services"],
+    "All Purchases": ["all other", "every purchase", "all purchases", "everything else", "everywhere else", "other purchases", "eligible purchases", "all other eligible purchases", "on all purchases", "unlimited cash rewards", "all other", "every purchase", "all purchases", "everything else", "everywhere else", "anywhere", "business", "other purchases", "anywhere mastercard is accepted"],
+    "Caps & Limits": ["up to", "per year", "quarterly maximum", "then 1%", "first year", "after the first year", "combined purchases", "first year"]
+}
+
+
+def keyword_regex(keywords) -> str:
+    """
+    Builds one regex alternation matching any of the keywords, factored into a trie.
+
+    Keywords sharing a prefix share its branch, so the regex engine only tests the few
+    alternatives that can follow each character instead of every keyword in turn. A keyword
+    that extends another one is dropped, since the shorter one already matches wherever it does.
+
+    Args:
+        keywords (iterable[str]): The keywords to match.
+
+    Returns:
+        str: The regex pattern.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node):
+        if "" in node:
+            return ""
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+# one pattern per category, tried in priority order
+CATEGORY_PATTERNS = [
+    (cat, re.compile(keyword_regex({k.lower() for k in keywords})))
+    for cat, keywords in CATEGORIES.items()
+]
+
+@lru_cache(maxsize=4096)
+def detect_category(clause_lower: str) -> str:
+    """
+    Detects the reward category based on keywords in the clause.
+
+    The first category, in CATEGORIES order, with a keyword anywhere in the clause wins.
+
+    Args:
+        clause_lower (str): The reward clause in lowercase.
+    
+    Returns:
+        str: The detected reward category.
+    """
+    for cat, pattern in CATEGORY_PATTERNS:
+        if pattern.search(clause_lower):
+            return cat
+    return "Other"
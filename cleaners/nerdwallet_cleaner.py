@@ -1,4 +1,6 @@
 import re
+from cleaners.categories import CATEGORIES, detect_category
+from cleaners.patterns import NUMBER_PATTERN, NW_PER_UNIT_PATTERN, NW_RATE_PATTERN, PARENTHETICAL_PATTERN
 
 UNITS = {
     "cash back": "cash back", "rewards": "rewards", "miles": "miles", "point": "points",
@@ -9,15 +11,6 @@ TYPES = {
     "X": "Multiplier", "%": "Percentage", "per_unit": "Per Unit", "flat": "Flat Amount"
 }
 
-CATEGORIES = {
-    "Travel": ["chase travel", "capital one travel", "amex travel", "cititravel.com", "travel center", "amextravel.com", "capital one entertainment", "purchases on travel", "hotel", "flight", "vacation", "travel", "rental car", "rental cars", "flights", "air travel", "airlines", "airline", "delta purchases", "united purchases", "southwest airlines", "united purchases","hotel", "hotels", "lodging", "hyatt stays", "marriott bonvoy", "hilton portfolio", "ihg hotels & resorts", "vacation rental", "prepaid hotel bookings", "rental car", "rental cars", "transit", "taxis", "rideshare"],
-    "Groceries & Dining": ["dining", "restaurants", "takeout", "delivery services", "supermarkets", "grocery store", "grocery stores", "wholesale club", "wholesale clubs", "amazon fresh", "whole foods market", "uber eats", "grocery store", "dining", "food delivery", "restaurant", "entertainment", "streaming service"],
-    "Gas & Utilities": ["gas station", "gas stations", "ev charging station", "phone plans", "cable and streaming service"],
-    "Retail & Entertainment": ["entertainment", "drugstore", "drugstores", "online retail purchases", "online groceries", "online retail", "amazon.com", "partner merchants", "local transit", "online retail purchases", "T-Mobile", "REI", "Williams-Sonoma", "Pottery Barn", "West Elm", "Bass Pro Shops", "Cabela’s", "BJ’s", "Kohl’s", "streaming subscription", "streaming subscriptions", "select streaming services", "select streaming","popular streaming services"],
-    "All Purchases": ["all other", "every purchase", "all purchases", "everything else", "everywhere else", "other purchases", "eligible purchases", "all other eligible purchases", "on all purchases", "unlimited cash rewards", "all other", "every purchase", "all purchases", "everything else", "everywhere else", "anywhere", "business", "other purchases", "anywhere mastercard is accepted"],
-    "Caps & Limits": ["up to", "per year", "quarterly maximum", "then 1%", "first year", "after the first year", "combined purchases", "first year"]
-}
-
 REWARD_CHECK_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([X%]|x\s+points|x\s+miles)") 
 FILTER_KEYWORDS = ["annual fee", "deposit", "credit line", "refundable", "minimum deposit"]
 FILTER_PATTERN = re.compile(r"|".join(FILTER_KEYWORDS))
@@ -42,21 +35,6 @@ def normalize_unit(unit_str: str) -> str:
     if "mile" in unit_str: return "miles"
     return "rewards"
 
-def detect_category(clause_lower: str) -> str:
-    """
-    Detects the reward category based on keywords in the clause.
-    
-    Args:
-        clause_lower (str): The reward clause in lowercase.
-    
-    Returns:
-        str: The detected reward category.
-    """
-
-    for cat, keywords in CATEGORIES.items():
-        if any(k.lower() in clause_lower for k in keywords): return cat
-    return "Other"
-
 def clean_rate(s: str) -> list[tuple]:
     """
     Cleans and parses a reward rate string into structured components.
@@ -68,17 +46,14 @@ def clean_rate(s: str) -> list[tuple]:
         list[tuple]: A list of tuples containing (value, rate_type, unit, category).
     """
     results = []
-    s = re.sub(r'\([^)]*\)', '', s)
+    s = PARENTHETICAL_PATTERN.sub('', s)
     s_lower = s.lower().replace("®", "").replace("℠", "").replace("™", "")
     clauses = [s]
     
     for clause in clauses:
         clause_lower = clause.lower()
 
-        m_list = re.findall(
-            r"(\d+(?:\.\d+)?)\s*(?:[X%]|x\s+points|x\s+miles|cash\s+back)\s*(.+?)(?:\.|$)", 
-            clause, re.IGNORECASE
-        )
+        m_list = NW_RATE_PATTERN.findall(clause)
         if m_list:
             for number_str, unit_phrase in m_list:
                 val = float(number_str)
@@ -95,10 +70,7 @@ def clean_rate(s: str) -> list[tuple]:
             
             continue
 
-        m_per_unit = re.search(
-            r"(\d+(?:\.\d+)?)\s*([a-zA-Z\s]+)\s*(per\s+\$1\s+spent|per\s+\$1|per\s+dollar\s+spent)", 
-            clause, re.IGNORECASE
-        )
+        m_per_unit = NW_PER_UNIT_PATTERN.search(clause)
         if m_per_unit:
             val = float(m_per_unit.group(1))
             unit = normalize_unit(m_per_unit.group(2))
@@ -152,7 +124,7 @@ def clean_annual_fee(s: str) -> int:
     Returns:
         int: The cleaned annual fee as an integer.
     """
-    nums = re.findall(r"\d+", s)
+    nums = NUMBER_PATTERN.findall(s)
     if len(nums) == 1:
         return int(nums[0])
     elif "intro" in s:
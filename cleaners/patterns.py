@@ -0,0 +1,29 @@
+import re
+
+# Every regex the cleaners run per clause, compiled once at import. Python's
+# own pattern cache is small, and between the two cleaners' inline patterns it
+# kept evicting and recompiling them.
+
+# shared
+NUMBER_PATTERN = re.compile(r"\d+")
+
+# Capital One rules
+CLAUSE_SPLIT_PATTERN = re.compile(r"(?<!\d\.)\b(?=\d+(?:\.\d+)?(?:X|%|\s+[a-zA-Z]))")
+CLAUSE_AMOUNT_PATTERN = re.compile(r"(\d|\$|¢)")
+GAS_DISCOUNT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)[¢c]?\s*off\/?(gallon|gal)")
+RATE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([X%])\s*(?:in\s+)?([a-zA-Z\s]+)?")
+DEPOSIT_AMOUNT_PATTERN = re.compile(r"\$?(\d+(?:\.\d+)?)")
+PER_UNIT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s+per\s+([\w$]+)")
+FLAT_AMOUNT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)")
+TRAILING_NUMBER_PATTERN = re.compile(r"(\s|\.)\d+$")
+
+# NerdWallet rules (also used for Chase and every other issuer, see cleaners.cleaner_for)
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)")
+NW_RATE_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(?:[X%]|x\s+points|x\s+miles|cash\s+back)\s*(.+?)(?:\.|$)",
+    re.IGNORECASE
+)
+NW_PER_UNIT_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*([a-zA-Z\s]+)\s*(per\s+\$1\s+spent|per\s+\$1|per\s+dollar\s+spent)",
+    re.IGNORECASE
+)
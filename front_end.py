@@ -6,12 +6,19 @@ habits and credit score, displays available credit cards, and visualizes the
 optimal card selection and estimated annual rewards using the solver backend.
 """
 
-from nicegui import ui
-import json
-from solver import get_dicts, optimize_cardspace
-import pandas as pd
+from startup_profile import phase
 import html
 
+with phase("import nicegui"):
+    from nicegui import ui
+with phase("import app state"):
+    from app_state import solutions, solver_pool, tier_catalogs
+    from catalog_cache import SCORE_TIERS
+    from incremental import IncrementalSession
+    from solver_pool import SolverBusy
+with phase("import api"):
+    import api  # registers the /api routes on NiceGUI's app
+
 def rewards_dict_to_html(d):
     out = ""
     for category, info in d.items():
@@ -33,66 +40,126 @@ def rewards_dict_to_html(d):
         """
     return out
 
-def load_cards(path: str = "cards_w_score.json"):
-	with open(path, "r", encoding="utf-8") as f:
-		data = json.load(f)
-	return data
+# cards per page of the "Browse Credit Cards" dialog
+CARDS_PAGE_SIZE = 20
+
+def card_body(card):
+    ui.label(f"Issuer: {card.get('issuer')}").classes("font-medium mb-2")
+    ui.label(f"Annual fee: {card.get('annual_fee')}").classes("text-sm")
+    ui.label(f"Typical credit score: {card.get('score')}").classes("text-sm mb-2")
+
+    # Rewards as bullet points
+    ui.label("Rewards:").classes("font-medium mb-1")
+    with ui.column().classes("pl-4 gap-1"):
+        rewards = card.get("rewards")
+        if rewards:
+            for r in rewards:
+                ui.label(f"• {r}").classes("text-sm")
+        else:
+            ui.label("• No rewards information available.").classes("text-sm italic")
+
+def card_expansion(card):
+    # the body is only built the first time the expansion is opened
+    def fill(event):
+        if event.value and not expansion.default_slot.children:
+            with expansion:
+                card_body(card)
+
+    expansion = ui.expansion(card.get("name"), on_value_change=fill).classes("w-full")
+
+BREAKDOWN_COLUMNS = [
+    {"field": "category", "label": "Category", "align": "left"},
+    {"field": "card", "label": "Card", "align": "left"},
+    {"field": "spend", "label": "Spend", "align": "right"},
+    {"field": "rate", "label": "Rate", "align": "right"},
+    {"field": "trigger_bonus", "label": "Bonus", "align": "right"},
+    {"field": "fee", "label": "Fee", "align": "right"},
+    {"field": "net_contribution", "label": "Net", "align": "right"},
+]
+
+def breakdown_rows(breakdown):
+    # one row per category of solver.summarize's breakdown, formatted for display
+    return [
+        {
+            "category": category,
+            "card": info["card"] or "—",
+            "spend": f"${info['spend']:,.2f}",
+            "rate": f"{info['rate']:.2%}",
+            "trigger_bonus": f"${info['trigger_bonus']:,.2f}",
+            "fee": f"${info['fee']:,.2f}",
+            "net_contribution": f"${info['net_contribution']:,.2f}",
+        }
+        for category, info in breakdown.items()
+    ]
 
-cards = load_cards()
+cards_dialog = ui.dialog()
+cards_dialog_built = False
+
+def build_cards_dialog():
+    store = tier_catalogs.store
+    filters = {"text": None, "issuer": None, "max_fee": None, "score": None}
+    state = {"rows": store.search(), "page": 1}
+
+    def update_filter(key, value):
+        filters[key] = value if value not in ("", None) else None
+        state["rows"] = store.search(**filters)
+        state["page"] = 1
+        card_list.refresh()
+
+    def show_page(event):
+        state["page"] = event.value
+        card_list.refresh()
+
+    # only the current page is ever turned into elements
+    @ui.refreshable
+    def card_list():
+        rows = state["rows"]
+        pages = max(1, -(-len(rows) // CARDS_PAGE_SIZE))
+        ui.label(f"Total cards found: {len(rows)}").classes("text-lg font-medium mb-2")
 
-# Group cards by issuer for sleeeker display
-cards_by_issuer = {}
-for card in cards:
-    issuer = card.get("issuer")
-    cards_by_issuer.setdefault(issuer, []).append(card)
+        with ui.column().classes("gap-3 max-h-[500px] overflow-y-auto w-full"):
+            first = (state["page"] - 1) * CARDS_PAGE_SIZE
+            issuer = None
+            for row in rows[first:first + CARDS_PAGE_SIZE]:
+                card = store.card(row)
+                if card.get("issuer") != issuer:
+                    issuer = card.get("issuer")
+                    ui.label(issuer).classes("text-xl font-semibold mt-2 mb-1 text-left")
+                card_expansion(card)
+
+        if pages > 1:
+            ui.pagination(1, pages, direction_links=True, value=state["page"], on_change=show_page)
+
+    with cards_dialog:
+        with ui.card().classes("w-2/3 mx-auto p-6 mt-4"):
+            ui.label("All Credit Cards").classes(
+                "text-3xl font-bold text-emerald-400 mb-4 text-center"
+            )
 
-cards_dialog = ui.dialog()
+            with ui.row().classes("items-end gap-3 w-full mb-2"):
+                ui.input("Search", on_change=lambda e: update_filter("text", e.value)).props(
+                    "clearable debounce=300"
+                ).classes("w-48")
+                ui.select(list(store.options("issuer")), label="Issuer", clearable=True,
+                          on_change=lambda e: update_filter("issuer", e.value)).classes("w-48")
+                ui.number("Max annual fee", min=0, on_change=lambda e: update_filter("max_fee", e.value)).classes("w-36")
+                ui.select(list(store.options("score")), label="Credit score", clearable=True,
+                          on_change=lambda e: update_filter("score", e.value)).classes("w-40")
 
-with cards_dialog:
-    with ui.card().classes("w-2/3 mx-auto p-6 mt-4"):
-        ui.label("All Credit Cards").classes(
-            "text-3xl font-bold text-emerald-400 mb-4 text-center"
-        )
-        ui.label(f"Total cards found: {len(cards)}").classes(
-            "text-lg font-medium mb-4"
-        )
+            card_list()
 
-        with ui.column().classes("gap-3 max-h-[500px] overflow-y-auto w-full"):
-            # Sort issuers alphabetically
-            for issuer in sorted(cards_by_issuer.keys()):
-                ui.label(issuer).classes("text-xl font-semibold mt-2 mb-1 text-left")
-
-                for card in cards_by_issuer[issuer]:
-                    card_name = card.get("name")
-
-                    # Expansion shows issuer and rewards bullets when clicked
-                    with ui.expansion(card_name).classes("w-full"):
-                        ui.label(f"Issuer: {issuer}").classes("font-medium mb-2")
-
-                        annual_fee = card.get("annual_fee")
-                        score = card.get("score")
-
-                        ui.label(f"Annual fee: {annual_fee}").classes("text-sm")
-                        ui.label(f"Typical credit score: {score}").classes("text-sm mb-2")
-
-                        rewards = card.get("rewards") or card.get("clean_rewards")
-
-                        # Rewards as bullet points
-                        ui.label("Rewards:").classes("font-medium mb-1")
-
-                        with ui.column().classes("pl-4 gap-1"):
-                            if isinstance(rewards, list):
-                                if rewards and isinstance(rewards[0], str):
-                                    for r in rewards:
-                                        ui.label(f"• {r}").classes("text-sm")
-                                else:
-                                    ui.label("• No rewards information available.").classes("text-sm italic")
-									
-        ui.button("Close", on_click=cards_dialog.close).classes(
-            "mt-4 bg-gray-300 px-4 py-2 rounded-lg"
-        )
+            ui.button("Close", on_click=cards_dialog.close).classes(
+                "mt-4 bg-gray-300 px-4 py-2 rounded-lg"
+            )
 
-with ui.column().classes(
+def open_cards_dialog():
+    global cards_dialog_built
+    if not cards_dialog_built:
+        build_cards_dialog()
+        cards_dialog_built = True
+    cards_dialog.open()
+
+with phase("build page"), ui.column().classes(
     "min-h-screen w-full items-center bg-white text-black"
 ):
 
@@ -117,7 +184,7 @@ with ui.column().classes(
         ).classes("text-2xl font-semibold text-green-300 font-medium max-w-2xl leading-relaxed text-left")
 
         with ui.row().classes("mt-4 gap-3"):
-            ui.button("Browse Credit Cards", on_click=cards_dialog.open).classes(
+            ui.button("Browse Credit Cards", on_click=open_cards_dialog).classes(
                 "bg-emerald-500 hover:bg-emerald-600 text-white font-semibold "
                 "px-4 py-2 rounded-full text-sm md:text-base shadow-lg shadow-emerald-900/50"
             )
@@ -133,8 +200,6 @@ with ui.column().classes(
 
     questions = [f"Monthly spend on {cat}" for cat in category_keys]
 
-    df= pd.read_json("cards_w_score.json")
-
     with ui.card().classes("w-1/2 mx-auto mt-10 p-6"):
         ui.label("Tell us about your spending habits:").classes("text-2xl font-bold mb-4")
 
@@ -154,34 +219,49 @@ with ui.column().classes(
                     inputs[category_keys[i]] = num
             ui.label("Which best describes your credit score?")
             dropdown = ui.select(
-                options=["Excellent", "Very Good", "Good", "Fair", "Poor"],
+                options=SCORE_TIERS,
                 value=None,                
                 with_input=False           
             )
 
         result_html = ui.html("", sanitize=None).classes("text-xl font-medium mt-5 text-green-600")
-
-        import html
-
-        def rewards_to_expansions(d):
-            for category, info in d.items():
-                with ui.expansion(category, icon='credit_card', value=False).classes('w-full'):
-                    ui.html("""
-                    <table class="reward-table">
-                    """, sanitize=None)
-
-                    for k, v in info.items():
-                        ui.html(f"""
-                            <tr>
-                                <td class="key">{html.escape(k)}</td>
-                                <td class="val">{html.escape(str(v))}</td>
-                            </tr>
-                        """, sanitize=None)
-
-                    ui.html("</table>", sanitize=None)
-
-
-        def submit():
+        spinner = ui.spinner(size="lg").classes("mt-4")
+        spinner.set_visibility(False)
+
+        # one grid of labels for the breakdown, built once per set of categories.
+        # ui.table resends every row on any change, while a label only sends
+        # itself, so a solve pushes just the cells whose text changed
+        breakdown_grid = ui.grid(columns=len(BREAKDOWN_COLUMNS)).classes("w-full mt-4 gap-x-4 gap-y-1")
+        breakdown_grid.set_visibility(False)
+        breakdown_cells = {}
+
+        def breakdown_cell(text, column):
+            return ui.label(text).classes("text-left" if column["align"] == "left" else "text-right")
+
+        def show_breakdown(breakdown):
+            rows = breakdown_rows(breakdown)
+            if [row["category"] for row in rows] != list(breakdown_cells):
+                breakdown_grid.clear()
+                breakdown_cells.clear()
+                with breakdown_grid:
+                    for column in BREAKDOWN_COLUMNS:
+                        breakdown_cell(column["label"], column).classes("font-bold")
+                    for row in rows:
+                        breakdown_cells[row["category"]] = [breakdown_cell(row[c["field"]], c) for c in BREAKDOWN_COLUMNS]
+            else:
+                for row in rows:
+                    for label, column in zip(breakdown_cells[row["category"]], BREAKDOWN_COLUMNS):
+                        if label.text != row[column["field"]]:
+                            label.set_text(row[column["field"]])
+            breakdown_grid.set_visibility(True)
+
+        # this client's incremental solver, kept across resubmits
+        session = IncrementalSession()
+
+        def session_solver(catalog, _fees, spending, score):
+            return session.solve(catalog, spending, score)
+
+        async def submit():
             try:
                 solver_inputs = {}
                 for key, element in inputs.items():
@@ -190,10 +270,28 @@ with ui.column().classes(
                 ui.notify("Please enter valid numbers.", color="red")
                 return
         
-            realistic_cards = df[df["score"] == dropdown.value]
-            dict_cards, fees= get_dicts(realistic_cards)
+            catalog = tier_catalogs.get(dropdown.value)
+
+            calculate_button.disable()
+            spinner.set_visibility(True)
+            result_html.set_content("Finding your optimal wallet...")
+            try:
+                chosen, total, held, breakdown = await solver_pool.run(
+                    solutions.solve, catalog, solver_inputs, 800, dropdown.value, tier_catalogs.version,
+                    session_solver,
+                )
+            except SolverBusy:
+                result_html.set_content("")
+                ui.notify("The optimizer is busy right now, please try again in a moment.", color="orange")
+                return
+            except TimeoutError:
+                result_html.set_content("")
+                ui.notify("The optimizer took too long, please try again.", color="red")
+                return
+            finally:
+                spinner.set_visibility(False)
+                calculate_button.enable()
 
-            chosen, total, held, breakdown = optimize_cardspace(dict_cards, fees, solver_inputs, 800)
             print(breakdown)
             output_lines = [f"<strong>Your optimal wallet is:</strong>"]
             elements_used = []
@@ -207,8 +305,8 @@ with ui.column().classes(
 
             result_html.set_content(html_content)
 
-            rewards_to_expansions(breakdown)
+            show_breakdown(breakdown)
 
-        ui.button("Calculate Annual Rewards", on_click=submit).classes("mt-4")
+        calculate_button = ui.button("Calculate Annual Rewards", on_click=submit).classes("mt-4")
 
 ui.run()
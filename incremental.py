@@ -0,0 +1,161 @@
+"""
+Incremental re-optimization for one user session.
+
+Users usually change a single spending input and resubmit. The session keeps
+the last solution and its own warm MILP model so that a resubmit only pays
+for what changed: nothing if the spending is identical, a re-pricing if the
+change provably cannot flip the wallet, and otherwise a fast-path or
+warm-started MILP solve with only the changed objective coefficients pushed.
+"""
+
+import threading
+
+import numpy as np
+
+from solver import (
+    BACKENDS,
+    backend_chain,
+    build_solution,
+    profile_arrays,
+    prune_candidates,
+    run_backends,
+    wallet_still_optimal,
+)
+
+
+class IncrementalSession:
+    """
+    Per-session solver that reuses the previous solution between submits.
+
+    Parameters
+    ----------
+    backend : str, optional
+        MILP backend for problems the fast path declines ("auto", "cbc" or
+        "highs"). Defaults to ``solver.SOLVER_BACKEND``.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.catalog = None
+        self.score = None
+        self.spending = None
+        self.values = None
+        self.assign = None
+        self.held_mask = None
+        self.solution = None
+        self.model = None
+        self.model_values = None
+        self.repeats = 0
+        self.skipped = 0
+        self.fast_solves = 0
+        self.milp_solves = 0
+        # a solve that timed out on the front end keeps running in its pool
+        # worker, so a resubmit has to wait for it
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """
+        Forget the previous solution and model.
+        """
+        self.catalog = None
+        self.spending = None
+        self.solution = None
+        self.model = None
+        self.model_values = None
+
+    def solve(self, catalog, spending, score):
+        """
+        Solve a spending profile, reusing the previous one where possible.
+
+        Parameters
+        ----------
+        catalog : CardCatalog
+            Compiled catalog to choose from.
+        spending : dict
+            Annual spending by category.
+        score : int
+            User's credit score.
+
+        Returns
+        -------
+        Tuple
+            Same ``(chosen, total, held, breakdown)`` tuple as
+            ``optimize_cardspace``.
+        """
+        with self._lock:
+            return self._solve(catalog, spending, score)
+
+    def _solve(self, catalog, spending, score):
+        if catalog is not self.catalog or score != self.score or list(spending) != list(self.spending or {}):
+            self.reset()
+            self.catalog = catalog
+            self.score = score
+
+        cats, values, bonus = profile_arrays(catalog, spending)
+        fee_vec = catalog.fees.astype(float)
+        eligible = catalog.eligible(score)
+
+        if self.solution is not None:
+            if all(spending[k] == self.spending[k] for k in cats):
+                self.repeats += 1
+                return self.solution
+
+            if wallet_still_optimal(self.values, values, self.assign, eligible):
+                self.skipped += 1
+                return self._store(spending, values, build_solution(
+                    catalog, cats, spending, self.assign, values, bonus, self.held_mask
+                ), self.assign, self.held_mask)
+
+        allowed, _ = prune_candidates(values, fee_vec, eligible)
+        result = run_backends(catalog, cats, values, fee_vec, allowed, ["fast"])
+
+        if result is not None:
+            self.fast_solves += 1
+        else:
+            # warm MILP over every eligible card so ``allowed`` stays fixed and
+            # only the changed categories' coefficients are pushed
+            if self.model is None:
+                milp = backend_chain(self.backend, fast_path=False)[-1]
+                self.model = BACKENDS[milp].model_cls(catalog.names, cats)
+                changed = None
+            else:
+                changed = list(np.flatnonzero((values != self.model_values).any(axis=0)))
+            start = (self.assign, self.held_mask) if self.solution is not None else None
+            result = self.model.solve(values, fee_vec, eligible, start=start, changed=changed)
+            self.model_values = values
+            self.milp_solves += 1
+            if result is None:
+                self.reset()
+                return None, 0.0, set(), {}, {}
+
+        assign, held_mask = result
+        if held_mask is None:
+            held_mask = np.zeros(len(catalog), dtype=bool)
+            held_mask[assign[assign >= 0]] = True
+        solution = build_solution(catalog, cats, spending, assign, values, bonus, held_mask)
+        return self._store(spending, values, solution, assign, held_mask)
+
+    def _store(self, spending, values, solution, assign, held_mask):
+        self.spending = dict(spending)
+        self.values = values
+        self.assign = assign
+        self.held_mask = held_mask
+        self.solution = solution
+        return solution
+
+    def stats(self):
+        """
+        How each submit of this session was answered.
+
+        Returns
+        -------
+        dict
+            Counts of ``repeats``, ``skipped`` solves, ``fast_solves`` and
+            ``milp_solves``.
+        """
+        return {
+            "repeats": self.repeats,
+            "skipped": self.skipped,
+            "fast_solves": self.fast_solves,
+            "milp_solves": self.milp_solves,
+        }
@@ -0,0 +1,222 @@
+"""
+Incremental refresh of the cleaned card catalog.
+
+Scraping is cheap next to cleaning every reward string again, and most cards
+do not change between refreshes. Each card is hashed on its raw name, fee
+and reward strings. Only new or changed cards go through the cleaners, and the results
+are merged into the existing catalog together with a changelog of what was
+added, removed or modified.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+from cleaners import cleaner_for
+
+RAW_FIELDS = ["name", "issuer", "annual_fee", "rewards", "score"]
+
+# what the cleaners read; the issuer is part of the card's key
+HASHED_FIELDS = ["name", "annual_fee", "rewards"]
+
+
+def missing(value):
+    """
+    Whether a field is unset, as None or as the NaN ``pd.read_json`` reads it back as.
+    """
+    return value is None or (isinstance(value, float) and pd.isna(value))
+
+
+def card_keys(cards):
+    """
+    Identity of each card across refreshes.
+
+    The same card can be listed more than once (NerdWallet repeats cards
+    across its category pages), so repeats are told apart by their position
+    among cards with the same issuer and name.
+
+    Parameters
+    ----------
+    cards : list
+        Card records with at least ``issuer`` and ``name``.
+
+    Returns
+    -------
+    list
+        ``(issuer, name, occurrence)`` per card.
+    """
+    seen = {}
+    keys = []
+    for card in cards:
+        pair = card["issuer"], card["name"]
+        keys.append((*pair, seen.get(pair, 0)))
+        seen[pair] = seen.get(pair, 0) + 1
+    return keys
+
+
+def card_hash(card):
+    """
+    Content hash of a card's raw name, fee and reward strings.
+
+    Parameters
+    ----------
+    card : dict or pd.Series
+        Card record. Missing fields in ``HASHED_FIELDS``, None or NaN, hash
+        as None.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+    raw = [card.get(field) for field in HASHED_FIELDS]
+    raw = [None if missing(v) else list(v) if not isinstance(v, str) and hasattr(v, "__iter__") else v for v in raw]
+    return hashlib.sha256(json.dumps(raw, ensure_ascii=False).encode()).hexdigest()
+
+
+def clean_card(card):
+    """
+    Run the issuer's cleaners on one raw card.
+
+    Parameters
+    ----------
+    card : dict or pd.Series
+        Raw card record.
+
+    Returns
+    -------
+    dict
+        The card with ``clean_annual_fee`` and ``clean_rewards`` filled in.
+    """
+    cleaner = cleaner_for(card["issuer"])
+    cleaned = dict(card)
+    cleaned["clean_annual_fee"] = cleaner.clean_annual_fee(card["annual_fee"])
+    cleaned["clean_rewards"] = [list(r) for r in cleaner.clean_rewards_list(card["rewards"])]
+    return cleaned
+
+
+def refresh_catalog(scraped, existing=None):
+    """
+    Merge a fresh scrape into the existing catalog, cleaning only what changed.
+
+    Cards of issuers that are missing from ``scraped`` are kept as they are, so
+    a partial scrape (e.g. one issuer failed) does not remove anything. A
+    scraped card without a score (Chase lists none) keeps its existing one;
+    a card whose score changed is modified but not cleaned again.
+
+    Parameters
+    ----------
+    scraped : pd.DataFrame
+        Raw scraped cards with the ``RAW_FIELDS`` columns.
+    existing : pd.DataFrame, optional
+        Current cleaned catalog. None treats every card as new.
+
+    Returns
+    -------
+    Tuple
+        The merged catalog DataFrame (existing order kept, new cards
+        appended) and the changelog dict with ``added``, ``removed`` and
+        ``modified`` lists of ``(issuer, name)`` pairs, the number of
+        ``unchanged`` listings and the score ``tiers`` touched by any change.
+    """
+    old_cards = [] if existing is None else existing.to_dict("records")
+    new_cards = scraped.to_dict("records")
+    old = dict(zip(card_keys(old_cards), old_cards))
+    new = dict(zip(card_keys(new_cards), new_cards))
+    scraped_issuers = {key[0] for key in new}
+
+    # cleaned fields by raw content, so a repeat or a card that only moved
+    # position is never cleaned twice
+    cleaned = {card_hash(card): card for card in old_cards}
+
+    def clean(card):
+        digest = card_hash(card)
+        if digest not in cleaned:
+            cleaned[digest] = clean_card(card)
+        return {**card, **{k: v for k, v in cleaned[digest].items() if k.startswith("clean_")}}
+
+    unchanged = 0
+    touched = set()
+    tiers = set()
+    merged = []
+
+    def score(card):
+        return None if missing(card.get("score")) else card["score"]
+
+    for key, card in old.items():
+        if key not in new:
+            if key[0] in scraped_issuers:
+                touched.add(key[:2])
+                tiers.add(score(card))
+            else:
+                merged.append(card)
+            continue
+        fresh = new[key]
+        if score(fresh) is None:
+            fresh = {**fresh, "score": card.get("score")}
+        if card_hash(card) == card_hash(fresh) and score(card) == score(fresh):
+            unchanged += 1
+            merged.append(card)
+        else:
+            touched.add(key[:2])
+            tiers.update([score(card), score(fresh)])
+            merged.append(clean(fresh))
+
+    for key, card in new.items():
+        if key not in old:
+            touched.add(key[:2])
+            tiers.add(score(card))
+            merged.append(clean(card))
+
+    # a card that gained or lost one of its repeats counts as modified
+    old_pairs = {key[:2] for key in old}
+    new_pairs = {key[:2] for key in new}
+    tiers.discard(None)
+    changelog = {
+        "added": sorted(touched - old_pairs),
+        "removed": sorted(touched - new_pairs),
+        "modified": sorted(touched & old_pairs & new_pairs),
+        "unchanged": unchanged,
+        "tiers": sorted(tiers),
+    }
+    columns = list(existing.columns) if existing is not None else list(scraped.columns) + ["clean_annual_fee", "clean_rewards"]
+    return pd.DataFrame(merged, columns=columns), changelog
+
+
+def refresh(scraped, path="cards_w_score.json", changelog_path="catalog_changelog.jsonl"):
+    """
+    Refresh a catalog file in place and append the changelog.
+
+    The file is only rewritten when something changed, so its mtime and hash
+    (and with them ``TierCatalogCache``) stay put on a no-op refresh.
+
+    Parameters
+    ----------
+    scraped : pd.DataFrame
+        Raw scraped cards.
+    path : str
+        Cleaned catalog JSON to merge into. Created if missing.
+    changelog_path : str, optional
+        JSON-lines file the changelog is appended to, with a timestamp. None
+        skips it.
+
+    Returns
+    -------
+    dict
+        The changelog from ``refresh_catalog``.
+    """
+    existing = pd.read_json(path) if os.path.exists(path) else None
+    catalog, changelog = refresh_catalog(scraped, existing)
+
+    if changelog["added"] or changelog["removed"] or changelog["modified"]:
+        tmp = f"{path}.tmp"
+        catalog.to_json(tmp, orient="records", indent=2)
+        os.replace(tmp, path)
+
+    if changelog_path is not None:
+        with open(changelog_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"time": time.time(), "path": path, **changelog}, ensure_ascii=False) + "\n")
+    return changelog
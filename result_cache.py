@@ -0,0 +1,153 @@
+"""
+Memoized optimization results.
+
+Solutions are cached under a canonical key built from the spending profile,
+the score tier, the cards the credit score makes eligible and the catalog
+version, so repeated (and, with bucketing, near-repeated) requests skip the
+solver entirely.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from solver import evaluate_wallet, optimize_cardspace
+
+
+class SolutionCache:
+    """
+    LRU cache of ``optimize_cardspace`` results with an optional TTL.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached solutions. The least recently used entry is
+        evicted first.
+    ttl : float, optional
+        Seconds a solution stays valid. None keeps entries until evicted.
+    bucket : float, optional
+        Opt-in quantization step for spending amounts. Profiles that round
+        to the same multiple of ``bucket`` share a key; on such a hit the
+        cached wallet is re-priced at the exact spending with
+        ``evaluate_wallet``, so the totals are exact but the wallet may be
+        slightly suboptimal for the unrounded profile.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, bucket=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.bucket = bucket
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, spending, tier, version, eligible):
+        """
+        Canonical cache key for a request.
+
+        Parameters
+        ----------
+        spending : dict
+            Annual spending by category.
+        tier : str
+            Score tier the catalog was filtered by.
+        version : str
+            Catalog version hash.
+        eligible : np.ndarray
+            ``catalog.eligible(score)``. Keying on the eligible cards rather
+            than the score lets scores that unlock the same cards share
+            entries.
+
+        Returns
+        -------
+        tuple
+            Hashable key, independent of category order.
+        """
+        if self.bucket:
+            amounts = {k: round(float(v) / self.bucket) * self.bucket for k, v in spending.items()}
+        else:
+            amounts = {k: float(v) for k, v in spending.items()}
+        return (version, tier, np.packbits(eligible).tobytes(), tuple(sorted(amounts.items())))
+
+    def solve(self, catalog, spending, score, tier, version, solver=optimize_cardspace):
+        """
+        Return the cached solution for a request, solving it on a miss.
+
+        Parameters
+        ----------
+        catalog : CardCatalog
+            Compiled catalog for ``tier``.
+        spending : dict
+            Annual spending by category.
+        score : int
+            User's credit score.
+        tier : str
+            Score tier the catalog was filtered by.
+        version : str
+            Catalog version hash.
+        solver : callable
+            Called as ``solver(catalog, None, spending, score)`` on a miss.
+
+        Returns
+        -------
+        Tuple
+            Same ``(chosen, total, held, breakdown)`` tuple as
+            ``optimize_cardspace``.
+        """
+        key = self.key(spending, tier, version, catalog.eligible(score))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or now - entry[0] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                solution = entry[1]
+            else:
+                self.misses += 1
+                solution = None
+
+        if solution is not None:
+            if self.bucket and solution[3] and any(row["spend"] != spending[k] for k, row in solution[3].items()):
+                return evaluate_wallet(catalog, solution[0], spending)
+            return solution
+
+        solution = solver(catalog, None, spending, score)
+        if solution[0] is None:
+            # no optimal solution, don't cache the failure
+            return solution
+
+        with self._lock:
+            self._entries[key] = (now, solution)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return solution
+
+    def clear(self):
+        """
+        Drop every cached solution.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Cache counters.
+
+        Returns
+        -------
+        dict
+            ``hits``, ``misses``, ``evictions`` and current ``size``.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
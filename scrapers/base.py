@@ -0,0 +1,70 @@
+import importlib
+import pandas as pd
+
+COLUMNS = ["name", "issuer", "annual_fee", "rewards", "score"]
+
+# key -> "module.ClassName", imported only when that issuer is scraped so a
+# missing browser or driver only breaks its own issuer
+SCRAPERS = {
+    "capital_one": "scrapers.capital_one_scraper.CapitalOneScraper",
+    "chase": "scrapers.chase_scraper.ChaseScraper",
+    "nerdwallet": "scrapers.nerdwallet_scraper.NerdWalletScraper",
+}
+
+
+class IssuerScraper:
+    """
+    Common interface for issuer scrapers.
+
+    Subclasses implement scrape() and register themselves in SCRAPERS. run() returns the
+    result with exactly the COLUMNS schema, so every issuer can be combined into one catalog.
+    """
+
+    key = None
+
+    def scrape(self) -> pd.DataFrame:
+        """
+        Gets the raw card data from the issuer.
+
+        Returns:
+            pd.DataFrame: The scraped cards, with at least name, issuer, annual_fee and rewards.
+        """
+        raise NotImplementedError
+
+    def run(self) -> pd.DataFrame:
+        """
+        Scrapes the issuer and normalizes the result to COLUMNS.
+
+        Returns:
+            pd.DataFrame: The scraped cards, with None for any column the issuer doesn't provide.
+        """
+        df = self.scrape()
+        for column in COLUMNS:
+            if column not in df:
+                df[column] = None
+        return df[COLUMNS].reset_index(drop=True)
+
+
+def register(key: str, path: str):
+    """
+    Adds an issuer scraper to the registry.
+
+    Args:
+        key(string): Short name of the issuer, e.g. "chase".
+        path(string): Dotted path of the IssuerScraper subclass, e.g. "scrapers.chase_scraper.ChaseScraper".
+    """
+    SCRAPERS[key] = path
+
+
+def load(path: str) -> IssuerScraper:
+    """
+    Imports and instantiates a scraper.
+
+    Args:
+        path(string): Dotted path of the IssuerScraper subclass, usually SCRAPERS[key].
+
+    Returns:
+        IssuerScraper: The scraper instance.
+    """
+    module, name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)()
@@ -3,9 +3,12 @@ import requests
 from urllib.parse import urljoin
 import re
 from tqdm import tqdm
-from scrapers.scraper_core import link2soup
+from scrapers.scraper_core import link2soup, scope
 import pandas as pd
 from cleaners.capital_one_cleaner import clean_annual_fee, clean_rewards_list
+from scrapers.base import IssuerScraper
+
+CARD_SELECTOR = "card-product-all-cards-list-item"
 
 score_conversion = {
     "Good-Excellent": "Very Good",
@@ -24,8 +27,8 @@ def scrape_capital_one(score = False, clean = False) -> pd.DataFrame:
         pd.DataFrame: A DataFrame containing the scraped credit card data.
     """
 
-    soup = link2soup("https://www.capitalone.com/credit-cards/compare/")
-    card_container = soup.select("card-product-all-cards-list-item")
+    soup = link2soup("https://www.capitalone.com/credit-cards/compare/", parse_only=scope(CARD_SELECTOR))
+    card_container = soup.select(CARD_SELECTOR)
     card_container = card_container[0:-1] #have some weird formatting with an extra block
 
     cards = {
@@ -66,4 +69,15 @@ def scrape_capital_one(score = False, clean = False) -> pd.DataFrame:
         df["clean_annual_fee"] = df["annual_fee"].apply(clean_annual_fee)
         df["clean_rewards"] = df["rewards"].apply(clean_rewards_list)
         
-    return df
\ No newline at end of file
+    return df
+
+
+class CapitalOneScraper(IssuerScraper):
+    """
+    Capital One cards, with their credit score tier, from the Capital One site.
+    """
+
+    key = "capital_one"
+
+    def scrape(self) -> pd.DataFrame:
+        return scrape_capital_one(score=True)
@@ -3,15 +3,18 @@ import requests
 from urllib.parse import urljoin
 import re
 from tqdm import tqdm
-from scrapers.scraper_core import link2soup
+from scrapers.scraper_core import link2soup, links2soups, scope, MAX_PER_HOST
 import pandas as pd
+from scrapers.base import IssuerScraper
 
-def scrape_chase() -> pd.DataFrame:
+CARD_SELECTOR = "div.cmp-cardsummary__inner-container"
+
+def scrape_chase(max_per_host: int = MAX_PER_HOST) -> pd.DataFrame:
     """
     Gets credit card data from Chase.
 
     Args:
-        None
+        max_per_host(int): Maximum product pages fetched at once. Defaults to MAX_PER_HOST.
 
     Returns:
         pd.DataFrame: A DataFrame containing the scraped credit card data.
@@ -19,9 +22,9 @@ def scrape_chase() -> pd.DataFrame:
     BASE = "https://creditcards.chase.com"
     LINK = "https://creditcards.chase.com/all-credit-cards?CELL=6TKX"
     
-    soup = link2soup(LINK)
+    soup = link2soup(LINK, parse_only=scope(CARD_SELECTOR))
     
-    card_containers = soup.select("div.cmp-cardsummary__inner-container")
+    card_containers = soup.select(CARD_SELECTOR)
     
     cards = {
         "name" : [],
@@ -31,7 +34,8 @@ def scrape_chase() -> pd.DataFrame:
     }
 
     
-    for card in tqdm(card_containers):
+    urls = []
+    for card in card_containers:
         title_container = card.select("div.cmp-cardsummary__inner-container__title h2 a")[0]
         name = re.sub(r"(®|Links to product page)", "", title_container.get_text(), flags=re.I).strip()
         cards["name"].append(name)
@@ -45,7 +49,12 @@ def scrape_chase() -> pd.DataFrame:
         annual_fee = re.split(r"[.;]", annual_fee)[0]
         cards["annual_fee"].append(annual_fee)
         
-        card_soup = link2soup(url)
+        urls.append(url)
+        cards["issuer"].append("Chase")
+
+    card_soups = links2soups(urls, max_per_host=max_per_host, desc="Chase")
+
+    for card_soup in card_soups:
         rewards = [re.sub(r"\n\n|\*", " ", r.text).strip()
                    for r in card_soup.select("div.cmp-rewardsbenefits__item p, \
                    div#container-43fa1cda69 h3, \
@@ -64,7 +73,16 @@ def scrape_chase() -> pd.DataFrame:
         
         cards["rewards"].append(filtered)
 
-        cards["issuer"].append("Chase")
-
     df = pd.DataFrame(cards)
-    return df
\ No newline at end of file
+    return df
+
+
+class ChaseScraper(IssuerScraper):
+    """
+    Chase cards from the Chase site.
+    """
+
+    key = "chase"
+
+    def scrape(self) -> pd.DataFrame:
+        return scrape_chase()
@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import threading
+from tqdm import tqdm
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+
+def headless_options() -> Options:
+    """
+    Chrome options for scraping: headless, no GPU and no images.
+
+    Returns:
+        Options: The options every pooled driver is started with.
+    """
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    return options
+
+
+class DriverPool:
+    """
+    A small pool of long-lived headless Chrome drivers shared through a work queue.
+
+    Drivers are started on first use, recycled after max_pages page loads and
+    replaced if they crash. Use it as a context manager so every browser is quit.
+
+    Args:
+        size(int): Number of drivers, and so of pages loaded in parallel. Defaults to 4.
+        max_pages(int): Page loads before a driver is quit and replaced. Defaults to 25.
+    """
+
+    def __init__(self, size: int = 4, max_pages: int = 25):
+        self.size = size
+        self.max_pages = max_pages
+        self.started = 0
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(None)
+        self._pages = {}
+        self._live = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _start(self) -> webdriver.Chrome:
+        driver = webdriver.Chrome(options=headless_options())
+        with self._lock:
+            self.started += 1
+            self._live.add(driver)
+        self._pages[driver] = 0
+        return driver
+
+    def _quit(self, driver: webdriver.Chrome):
+        with self._lock:
+            self._live.discard(driver)
+        self._pages.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def run(self, fn, item):
+        """
+        Runs fn(driver, item) on the next idle driver.
+
+        Args:
+            fn(callable): Function taking a driver and an item.
+            item: Item to hand to fn, e.g. a URL.
+
+        Returns:
+            Whatever fn returns.
+        """
+        driver = self._idle.get()
+        try:
+            if driver is None:
+                driver = self._start()
+            result = fn(driver, item)
+            self._pages[driver] += 1
+            if self._pages[driver] >= self.max_pages:
+                self._quit(driver)
+                driver = None
+            return result
+        except TimeoutException:
+            # the page was slow, the browser is still fine
+            raise
+        except WebDriverException:
+            # a crashed browser is not reused; driver is None if it never started
+            if driver is not None:
+                self._quit(driver)
+            driver = None
+            raise
+        finally:
+            self._idle.put(driver)
+
+    def map(self, fn, items: list, progress: bool = True, desc: str = None) -> list:
+        """
+        Runs fn(driver, item) for every item, size items at a time.
+
+        Args:
+            fn(callable): Function taking a driver and an item.
+            items(list): Items to process, e.g. URLs.
+            progress(bool): Whether to show a tqdm progress bar. Defaults to True.
+            desc(string): Label for the progress bar. Defaults to None.
+
+        Returns:
+            list: The result for each item, in the same order as items.
+        """
+        results = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = {executor.submit(self.run, fn, item): i for i, item in enumerate(items)}
+            for future in tqdm(as_completed(futures), total=len(futures), desc=desc, disable=not progress):
+                results[futures[future]] = future.result()
+        return results
+
+    def close(self):
+        """
+        Quits every driver the pool started.
+        """
+        with self._lock:
+            drivers = list(self._live)
+        for driver in drivers:
+            self._quit(driver)
+        self._idle = queue.Queue()
+        for _ in range(self.size):
+            self._idle.put(None)
@@ -1,16 +1,19 @@
 from bs4 import BeautifulSoup
 import requests
-from scrapers.scraper_core import link2soup
+from scrapers.scraper_core import link2soup, parse, scope
 import pandas as pd
 import re
 from tqdm import tqdm
 from cleaners.nerdwallet_cleaner import clean_rewards_list, clean_annual_fee
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from scrapers.driver_pool import DriverPool
+from scrapers.base import IssuerScraper
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
+CATEGORY_LIST_SELECTOR = "ul#l3ListWrapper-0-0"
+BLOCK_SELECTOR = "div.MuiBox-root.css-1hlkqtw"
+
 score_conversion = {
     "Rebuilding": "Poor",
     "Fair": "Fair",
@@ -21,7 +24,27 @@ score_conversion = {
 }
 
 
-def scrape_nerdwallet(clean: bool = False, discluded_providers: list = [], score: bool = False)-> pd.DataFrame:
+def load_page(driver, href: str) -> str:
+    """
+    Loads a NerdWallet category page and waits for the card tables to render.
+
+    Args:
+        driver(webdriver.Chrome): The driver to load the page with.
+        href(string): The URL of the category page.
+
+    Returns:
+        string: The rendered HTML of the page.
+    """
+    driver.get(href)
+
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "div.MuiGrid-root.MuiGrid-container.MuiGrid-direction-xs-row.css-1a97p8s div.MuiBox-root.css-79elbk"))
+    )
+    return driver.page_source
+
+
+def scrape_nerdwallet(clean: bool = False, discluded_providers: list = [], score: bool = False,
+                      drivers: int = 4, pages_per_driver: int = 25)-> pd.DataFrame:
     """
     Gets credit card data from NerdWallet.
 
@@ -29,16 +52,18 @@ def scrape_nerdwallet(clean: bool = False, discluded_providers: list = [], score
         clean(bool): Whether to clean the data after scraping. Defaults to False.
         discluded_providers(list): A list of card issuers to exclude from the results. Defaults to [].
         score(bool): Whether to include credit score information. Defaults to False.
+        drivers(int): Number of headless browsers loading pages in parallel. Defaults to 4.
+        pages_per_driver(int): Pages a browser loads before it is restarted. Defaults to 25.
 
     Returns:
         pd.DataFrame: A DataFrame containing the scraped credit card data.
     """
 
-    main_soup = link2soup("https://www.nerdwallet.com/credit-cards")
+    main_soup = link2soup("https://www.nerdwallet.com/credit-cards", parse_only=scope(CATEGORY_LIST_SELECTOR))
     
     hrefs = [
         a["href"]
-        for li in main_soup.select("ul#l3ListWrapper-0-0 > li.l3ListItem._3DKUn-t")
+        for li in main_soup.select(f"{CATEGORY_LIST_SELECTOR} > li.l3ListItem._3DKUn-t")
         if (a := li.find("a", href=True))
     ]
 
@@ -52,19 +77,12 @@ def scrape_nerdwallet(clean: bool = False, discluded_providers: list = [], score
     if score:
         cards["score"] = []
     
-    for href in tqdm(hrefs):
-        options = Options()
-        options.add_argument("--headless")
-        driver = webdriver.Chrome(options=options)
-        driver.get(href)
-
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.MuiGrid-root.MuiGrid-container.MuiGrid-direction-xs-row.css-1a97p8s div.MuiBox-root.css-79elbk"))
-        )
-        html = driver.page_source
-        
-        best_soup = BeautifulSoup(html, "html.parser")
-        blocks = best_soup.select("div.MuiBox-root.css-1hlkqtw")
+    with DriverPool(size=drivers, max_pages=pages_per_driver) as pool:
+        pages = pool.map(load_page, hrefs, desc="NerdWallet")
+
+    for html in pages:
+        best_soup = parse(html, scope(BLOCK_SELECTOR))
+        blocks = best_soup.select(BLOCK_SELECTOR)
         
         for block in blocks:
             name = block.select("h3.MuiTypography-root.MuiTypography-body1.css-monr6r")[0].text
@@ -125,4 +143,20 @@ def scrape_nerdwallet(clean: bool = False, discluded_providers: list = [], score
         df["clean_annual_fee"] = df["annual_fee"].apply(clean_annual_fee)
         df["clean_rewards"] = df["rewards"].apply(clean_rewards_list)
     
-    return df
\ No newline at end of file
+    return df
+
+
+class NerdWalletScraper(IssuerScraper):
+    """
+    Cards of every other issuer, with their credit score tier, from NerdWallet.
+
+    Issuers that have their own scraper are left out.
+    """
+
+    key = "nerdwallet"
+
+    def __init__(self, discluded_providers: list = ["capital one", "chase"]):
+        self.discluded_providers = discluded_providers
+
+    def scrape(self) -> pd.DataFrame:
+        return scrape_nerdwallet(discluded_providers=self.discluded_providers, score=True)
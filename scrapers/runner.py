@@ -0,0 +1,62 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import time
+import traceback
+import pandas as pd
+from scrapers.base import COLUMNS, SCRAPERS, load
+
+
+def scrape_issuer(path: str) -> tuple:
+    """
+    Runs one scraper, catching any failure.
+
+    Args:
+        path(string): Dotted path of the IssuerScraper subclass.
+
+    Returns:
+        tuple: The normalized DataFrame (None on failure), the seconds taken and the traceback (None on success).
+    """
+    start = time.perf_counter()
+    try:
+        df = load(path).run()
+        error = None
+    except Exception:
+        df = None
+        error = traceback.format_exc()
+    return df, time.perf_counter() - start, error
+
+
+def scrape_all(keys: list = None, workers: int = None, processes: bool = True) -> tuple:
+    """
+    Scrapes every issuer in parallel and combines them into one catalog.
+
+    Each issuer runs in its own worker, so wall time is that of the slowest issuer rather than
+    the sum, and an issuer that fails is reported in the stats instead of aborting the run.
+
+    Args:
+        keys(list): Issuers to scrape. Defaults to every key in SCRAPERS.
+        workers(int): Number of workers. Defaults to one per issuer.
+        processes(bool): Use worker processes instead of threads. Defaults to True.
+
+    Returns:
+        tuple: The combined DataFrame with the COLUMNS schema and a dict of per-issuer stats
+            (seconds, cards and error).
+    """
+    keys = list(SCRAPERS) if keys is None else keys
+    executor_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+    frames = []
+    stats = {}
+    with executor_cls(max_workers=workers or max(len(keys), 1)) as executor:
+        futures = {key: executor.submit(scrape_issuer, SCRAPERS[key]) for key in keys}
+        for key, future in futures.items():
+            try:
+                df, seconds, error = future.result()
+            except Exception:
+                # the worker process itself died
+                df, seconds, error = None, None, traceback.format_exc()
+            stats[key] = {"seconds": seconds, "cards": 0 if df is None else len(df), "error": error}
+            if df is not None:
+                frames.append(df)
+
+    catalog = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUMNS)
+    return catalog, stats
@@ -1,16 +1,352 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from urllib.parse import urlsplit
+import hashlib
+import re
+import json
+import os
+import threading
+import time
+from tqdm import tqdm
 
-def link2soup(url: str) -> BeautifulSoup:
+TIMEOUT = 15
+RETRIES = 3
+BACKOFF = 0.5
+MAX_PER_HOST = 8
+POOL_SIZE = 32
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+CACHE_DIR = os.environ.get("SCRAPER_CACHE_DIR", ".scraper_cache")
+CACHE_TTL = float(os.environ.get("SCRAPER_CACHE_TTL", 0))
+REPLAY = os.environ.get("SCRAPER_REPLAY", "") == "1"
+
+# lxml builds the same tree several times faster than the pure-Python parser
+try:
+    import lxml
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    DEFAULT_PARSER = "html.parser"
+PARSER = os.environ.get("SCRAPER_PARSER", DEFAULT_PARSER)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the connection-pooled session shared by every scraper.
+
+    Returns:
+        requests.Session: A session that keeps up to POOL_SIZE connections open per host.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=POOL_SIZE)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def request(url: str, session: requests.Session = None, headers: dict = None, timeout: float = TIMEOUT,
+            retries: int = RETRIES, backoff: float = BACKOFF) -> requests.Response:
+    """
+    Sends a GET request, retrying connection errors, timeouts and 429/5xx responses.
+
+    Args:
+        url(string): The URL of the webpage to fetch.
+        session(requests.Session): Session to fetch with. Defaults to the shared session.
+        headers(dict): Extra request headers. Defaults to None.
+        timeout(float): Seconds to wait for the server on each attempt. Defaults to TIMEOUT.
+        retries(int): Extra attempts after the first one fails. Defaults to RETRIES.
+        backoff(float): Seconds to wait before the first retry, doubled on every further retry. Defaults to BACKOFF.
+
+    Returns:
+        requests.Response: The last response.
+    """
+    session = session or get_session()
+    for attempt in range(retries + 1):
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+        time.sleep(backoff * 2 ** attempt)
+
+
+class CacheMiss(LookupError):
+    """
+    Raised in replay mode when a URL has no stored response.
+    """
+
+
+class ResponseCache:
+    """
+    On-disk store of page bodies keyed by URL, revalidated with conditional requests.
+
+    A stored page younger than ttl seconds is returned without touching the network.
+    Older pages are re-requested with If-None-Match/If-Modified-Since, so an unchanged
+    page costs a 304 instead of a full download. In replay mode the network is never
+    used, which lets cleaners be developed and tested against saved pages.
+
+    Args:
+        path(string): Directory holding the stored pages. Defaults to CACHE_DIR.
+        ttl(float): Seconds a stored page is trusted without revalidation; None trusts it forever. Defaults to CACHE_TTL.
+        replay(bool): Serve only stored pages and raise CacheMiss for anything else. Defaults to REPLAY.
+    """
+
+    def __init__(self, path: str = CACHE_DIR, ttl: float = CACHE_TTL, replay: bool = REPLAY):
+        self.path = path
+        self.ttl = ttl
+        self.replay = replay
+        self.hits = 0
+        self.revalidated = 0
+        self.fetched = 0
+        self._lock = threading.Lock()
+
+    def _file(self, url: str, ext: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(url.encode()).hexdigest() + ext)
+
+    def _write(self, file: str, text: str):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = f"{file}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, file)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def load(self, url: str) -> dict:
+        """
+        Reads the stored response for a URL.
+
+        Args:
+            url(string): The URL of the webpage.
+
+        Returns:
+            dict: The stored url, etag, last_modified, fetched_at and body, or None if the URL was never stored.
+        """
+        try:
+            with open(self._file(url, ".json"), encoding="utf-8") as f:
+                entry = json.load(f)
+            with open(self._file(url, ".html"), encoding="utf-8") as f:
+                entry["body"] = f.read()
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def store(self, url: str, response: requests.Response) -> dict:
+        """
+        Saves a response body and its validators.
+
+        Args:
+            url(string): The URL of the webpage.
+            response(requests.Response): The response to store.
+
+        Returns:
+            dict: The stored entry.
+        """
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        self._write(self._file(url, ".html"), response.text)
+        self._write(self._file(url, ".json"), json.dumps(entry))
+        entry["body"] = response.text
+        return entry
+
+    def fetch(self, url: str, session: requests.Session = None, **kwargs) -> str:
+        """
+        Gets a webpage from the store, revalidating or downloading it when needed.
+
+        Args:
+            url(string): The URL of the webpage.
+            session(requests.Session): Session to fetch with. Defaults to the shared session.
+            **kwargs: Passed on to request (timeout, retries, backoff).
+
+        Returns:
+            string: The page body.
+        """
+        entry = self.load(url)
+        if self.replay:
+            if entry is None:
+                raise CacheMiss(url)
+            self._count("hits")
+            return entry["body"]
+
+        if entry is not None and (self.ttl is None or time.time() - entry["fetched_at"] < self.ttl):
+            self._count("hits")
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = request(url, session, headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            body = entry.pop("body")
+            entry["fetched_at"] = time.time()
+            self._write(self._file(url, ".json"), json.dumps(entry))
+            return body
+
+        self._count("fetched")
+        if response.ok:
+            self.store(url, response)
+        return response.text
+
+    def stats(self) -> dict:
+        """
+        Cache counters.
+
+        Returns:
+            dict: Pages served from the store (hits), confirmed unchanged by a 304 (revalidated) and downloaded (fetched).
+        """
+        return {"hits": self.hits, "revalidated": self.revalidated, "fetched": self.fetched}
+
+
+response_cache = ResponseCache()
+
+
+def fetch(url: str, session: requests.Session = None, cache=True, **kwargs) -> str:
+    """
+    Gets the HTML content of a webpage, through the response cache unless told otherwise.
+
+    Args:
+        url(string): The URL of the webpage to fetch.
+        session(requests.Session): Session to fetch with. Defaults to the shared session.
+        cache(bool or ResponseCache): True for the shared response_cache, False to always download, or a specific cache. Defaults to True.
+        **kwargs: Passed on to request (timeout, retries, backoff).
+
+    Returns:
+        string: The page body.
+    """
+    if cache is True:
+        cache = response_cache
+    if not cache:
+        return request(url, session, **kwargs).text
+    return cache.fetch(url, session, **kwargs)
+
+
+def fetch_all(urls: list, max_per_host: int = MAX_PER_HOST, progress: bool = True,
+              desc: str = None, **kwargs) -> list:
+    """
+    Fetches many webpages concurrently over the shared session.
+
+    At most max_per_host requests are in flight to any one host, so wall time scales
+    with len(urls) / max_per_host instead of len(urls).
+
+    Args:
+        urls(list): The URLs to fetch.
+        max_per_host(int): Maximum concurrent requests per host. Defaults to MAX_PER_HOST.
+        progress(bool): Whether to show a tqdm progress bar. Defaults to True.
+        desc(string): Label for the progress bar. Defaults to None.
+        **kwargs: Passed on to fetch (cache, timeout, retries, backoff).
+
+    Returns:
+        list: The body of each page, in the same order as urls.
+    """
+    hosts = defaultdict(lambda: threading.Semaphore(max_per_host))
+    for url in urls:
+        hosts[urlsplit(url).netloc]
+
+    def fetch_limited(url):
+        with hosts[urlsplit(url).netloc]:
+            return fetch(url, **kwargs)
+
+    pages = [None] * len(urls)
+    if not urls:
+        return pages
+
+    with ThreadPoolExecutor(max_workers=max_per_host * len(hosts)) as executor:
+        futures = {executor.submit(fetch_limited, url): i for i, url in enumerate(urls)}
+        for future in tqdm(as_completed(futures), total=len(futures), desc=desc, disable=not progress):
+            pages[futures[future]] = future.result()
+    return pages
+
+
+def scope(selector: str) -> SoupStrainer:
+    """
+    Builds a SoupStrainer from a simple CSS selector such as "div.card-item", "ul#list" or "my-element".
+
+    Args:
+        selector(string): One compound selector: an optional tag name followed by .class and #id parts.
+
+    Returns:
+        SoupStrainer: A strainer that keeps the matching elements and their contents.
+    """
+    name = re.match(r"[\w-]*", selector).group() or None
+    classes = set(re.findall(r"\.([\w-]+)", selector))
+    ids = re.findall(r"#([\w-]+)", selector)
+
+    attrs = {}
+    if ids:
+        attrs["id"] = ids[0]
+    if classes:
+        # while parsing, class is still the raw space-separated string
+        attrs["class"] = lambda c: c is not None and classes <= set(c.split() if isinstance(c, str) else c)
+    return SoupStrainer(name, attrs)
+
+
+def parse(html: str, parse_only: SoupStrainer = None) -> BeautifulSoup:
+    """
+    Parses HTML with the fastest available parser, optionally keeping only part of the page.
+
+    Args:
+        html(string): The HTML to parse.
+        parse_only(SoupStrainer): Only build the elements it matches (and their contents). Selectors that
+            depend on ancestors outside those elements will no longer match. Defaults to None, the whole page.
+
+    Returns:
+        BeautifulSoup: A BeautifulSoup object containing the parsed HTML content.
+    """
+    return BeautifulSoup(html, PARSER, parse_only=parse_only)
+
+
+def link2soup(url: str, session: requests.Session = None, parse_only: SoupStrainer = None) -> BeautifulSoup:
     """
     Gets the HTML content of a webpage and parses it into a BeautifulSoup object.
 
     Args:
         url(string): The URL of the webpage to scrape.
+        session(requests.Session): Session to fetch with. Defaults to the shared session.
+        parse_only(SoupStrainer): Only parse the matching part of the page. Defaults to None, the whole page.
 
     Returns:
         BeautifulSoup: A BeautifulSoup object containing the parsed HTML content.
     """
-    
-    response = requests.get(url)
-    return BeautifulSoup(response.text, 'html.parser')
+
+    return parse(fetch(url, session), parse_only)
+
+
+def links2soups(urls: list, max_per_host: int = MAX_PER_HOST, progress: bool = True, desc: str = None,
+                parse_only: SoupStrainer = None) -> list:
+    """
+    Fetches many webpages concurrently and parses each into a BeautifulSoup object.
+
+    Args:
+        urls(list): The URLs of the webpages to scrape.
+        max_per_host(int): Maximum concurrent requests per host. Defaults to MAX_PER_HOST.
+        progress(bool): Whether to show a tqdm progress bar. Defaults to True.
+        desc(string): Label for the progress bar. Defaults to None.
+        parse_only(SoupStrainer): Only parse the matching part of each page. Defaults to None, the whole page.
+
+    Returns:
+        list: A BeautifulSoup object per URL, in the same order as urls.
+    """
+    pages = fetch_all(urls, max_per_host=max_per_host, progress=progress, desc=desc)
+    return [parse(page, parse_only) for page in pages]
@@ -1,7 +1,21 @@
-import pulp
-import pandas as pd
+import importlib.util
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+import weakref
+import numpy as np
 from typing import Dict
 
+logger = logging.getLogger(__name__)
+
+# pulp, pandas and highspy are imported inside the functions that need them:
+# importing them costs about as much as the rest of the app, and a front-end
+# worker only needs pandas to build a catalog and a solver for a MILP solve.
+HAVE_HIGHSPY = importlib.util.find_spec("highspy") is not None
+
 POINTS_TO_CASH: Dict[str, Dict[str, float]]= {
     "default": {
         "miles": 0.01,
@@ -50,7 +64,7 @@ POINTS_TO_CASH: Dict[str, Dict[str, float]]= {
 }
 
 def get_conversion_rate(issuer: str, unit: str) -> float:
-     """
+    """
     Return the cash-equivalent conversion rate for a reward unit issued by a
     given card issuer.
 
@@ -77,11 +91,266 @@ def get_conversion_rate(issuer: str, unit: str) -> float:
     # fallback to default valuation for this unit
     return POINTS_TO_CASH["default"].get(unit, 0.01)
 
-def get_dicts(df):
+# reward types that contribute a per-dollar rate
+RATE_TYPES = ("Multiplier", "Per Unit", "Percentage")
+
+# storage type of the compiled rate matrix and fee vector
+CATALOG_DTYPE = np.float32
+
+# float32 keeps about seven significant digits, so rates are rounded back
+# to this many decimals when they are widened for the solver
+RATE_DECIMALS = 7
+
+
+class CardCatalog:
+    """
+    Array-backed card catalog consumed by the optimizer.
+
+    Attributes
+    ----------
+    names : list
+        Card names, one per row.
+    categories : list
+        Reward categories, one per column.
+    rates : np.ndarray
+        Cash-equivalent reward rates of shape (cards, categories).
+    fees : np.ndarray
+        Annual fee per card.
+    min_scores : np.ndarray
+        Minimum credit score per card.
+    triggers : list
+        Trigger rewards as (card row, category column, min_spend, bonus).
+    card_index : dict
+        Mapping card name -> row.
+    category_index : dict
+        Mapping category -> column.
+    """
+
+    def __init__(self, names, categories, rates, fees, min_scores=None, triggers=()):
+        self.names = list(names)
+        self.categories = list(categories)
+        self.rates = np.asarray(rates, dtype=CATALOG_DTYPE).reshape(len(self.names), len(self.categories))
+        self.fees = np.asarray(fees, dtype=CATALOG_DTYPE).reshape(len(self.names))
+        if min_scores is None:
+            min_scores = np.zeros(len(self.names))
+        self.min_scores = np.asarray(min_scores, dtype=CATALOG_DTYPE).reshape(len(self.names))
+        self.triggers = list(triggers)
+        self.card_index = {c: i for i, c in enumerate(self.names)}
+        self.category_index = {k: j for j, k in enumerate(self.categories)}
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_dicts(cls, cards, fees):
+        """
+        Build a catalog from the dictionaries returned by ``get_dicts``.
+
+        Parameters
+        ----------
+        cards : dict
+            Mapping card -> { "min_score", "rates", "triggers" }.
+        fees : dict
+            Mapping card -> annual fee.
+
+        Returns
+        -------
+        CardCatalog
+            The same cards in array form.
+        """
+        names = list(cards.keys())
+        categories = list(dict.fromkeys(
+            k for c in names for k in (*cards[c]["rates"], *cards[c].get("triggers", {}))
+        ))
+        category_index = {k: j for j, k in enumerate(categories)}
+
+        rates = np.zeros((len(names), len(categories)))
+        triggers = []
+        for i, c in enumerate(names):
+            for k, rate in cards[c]["rates"].items():
+                rates[i, category_index[k]] = rate
+            for k, trigs in cards[c].get("triggers", {}).items():
+                triggers.extend((i, category_index[k], min_spend, bonus) for min_spend, bonus in trigs)
+
+        return cls(
+            names,
+            categories,
+            rates,
+            [fees[c] for c in names],
+            [cards[c].get("min_score", 0) for c in names],
+            triggers,
+        )
+
+    def to_dicts(self):
         """
+        Convert the catalog back into the ``(cards_dict, fees_dict)`` form
+        returned by ``get_dicts``.
+
+        Returns
+        -------
+        Tuple[dict, dict]
+            cards_dict : dict
+                Mapping card -> { "min_score", "rates", "triggers" }.
+            fees_dict : dict
+                Mapping card -> annual fee.
+        """
+        rates = self.rates_for(self.categories)
+        cards_dict = {}
+        for i, c in enumerate(self.names):
+            triggers = {}
+            for row, col, min_spend, bonus in self.triggers:
+                if row == i:
+                    triggers.setdefault(self.categories[col], []).append((min_spend, bonus))
+            cards_dict[c] = {
+                "min_score": int(self.min_scores[i]),
+                "rates": {k: rates[i, j] for j, k in enumerate(self.categories) if rates[i, j] > 0},
+                "triggers": triggers,
+            }
+        fees_dict = {c: float(f) for c, f in zip(self.names, self.fees)}
+        return cards_dict, fees_dict
+
+    def rates_for(self, cats):
+        """
+        Reward rates for a list of spending categories.
+
+        Parameters
+        ----------
+        cats : list
+            Spending categories. Categories missing from the catalog get a
+            zero rate.
+
+        Returns
+        -------
+        np.ndarray
+            Float64 array of shape (cards, len(cats)).
+        """
+        out = np.zeros((len(self.names), len(cats)))
+        for j, k in enumerate(cats):
+            if k in self.category_index:
+                out[:, j] = self.rates[:, self.category_index[k]]
+        return np.round(out, RATE_DECIMALS)
+
+    def eligible(self, score):
+        """
+        Boolean mask of the cards a user with this credit score can hold.
+        """
+        return score >= self.min_scores
+
+    def values(self, spend, cats):
+        """
+        Annual reward values for one or more spending profiles.
+
+        Parameters
+        ----------
+        spend : np.ndarray
+            Annual spending of shape (profiles, len(cats)).
+        cats : list
+            Spending categories matching the columns of ``spend``.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            values : np.ndarray
+                ``spend * rate + trigger_bonus`` of shape
+                (profiles, cards, len(cats)).
+            bonus : np.ndarray
+                The trigger bonus part of ``values``.
+        """
+        spend = np.asarray(spend, dtype=float)
+        bonus = np.zeros((spend.shape[0], len(self.names), len(cats)))
+        positions = {k: j for j, k in enumerate(cats)}
+        for row, col, min_spend, amount in self.triggers:
+            j = positions.get(self.categories[col])
+            if j is not None:
+                bonus[:, row, j] += np.where(spend[:, j] >= min_spend, amount, 0.0)
+        values = spend[:, None, :] * self.rates_for(cats)[None, :, :] + bonus
+        return values, bonus
+
+
+def compile_catalog(df):
+    """
+    Compile a cleaned rewards dataset into a ``CardCatalog``.
+
+    Rewards are exploded into one row per reward, converted to cash with
+    ``get_conversion_rate`` (evaluated once per issuer/unit pair) and reduced
+    to the best rate per card and category with a single groupby. Duplicate
+    card names keep the last row, as ``get_dicts`` always has.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame containing cleaned card metadata and reward definitions.
+
+    Returns
+    -------
+    CardCatalog
+        Dense rate matrix, fee vector and card/category index.
+    """
+    import pandas as pd
+
+    names = pd.unique(df["name"])
+    cards = df.drop_duplicates("name", keep="last").set_index("name").loc[names]
+
+    columns = ["issuer", "clean_rewards"] + (["min_spend"] if "min_spend" in cards else [])
+    rewards = cards[columns].explode("clean_rewards")
+    rewards = rewards[rewards["clean_rewards"].str.len() > 0]
+
+    value = rewards["clean_rewards"].str[0].astype(float)
+    rtype = rewards["clean_rewards"].str[1]
+    unit = rewards["clean_rewards"].str[2]
+    category = rewards["clean_rewards"].str[3]
+
+    # issuer based conversion
+    pairs = pd.MultiIndex.from_arrays([rewards["issuer"], unit])
+    conversion = pd.Series([get_conversion_rate(i, u) for i, u in pairs.unique()], index=pairs.unique())
+    cash = value * conversion.reindex(pairs).to_numpy()
+
+    categories = list(pd.unique(category))
+    is_rate = rtype.isin(RATE_TYPES)
+    rates = (
+        pd.DataFrame({
+            "name": cash.index[is_rate],
+            "category": category[is_rate].to_numpy(),
+            "cash": cash[is_rate].to_numpy(),
+        })
+        .groupby(["name", "category"])["cash"].max()
+        .unstack(fill_value=0.0)
+        .reindex(index=names, columns=categories, fill_value=0.0)
+        .clip(lower=0.0)
+    )
+
+    triggers = []
+    is_trigger = rtype == "Trigger"
+    if is_trigger.any():
+        card_index = {c: i for i, c in enumerate(names)}
+        category_index = {k: j for j, k in enumerate(categories)}
+        for name, k, amount, min_spend in zip(cash.index[is_trigger], category[is_trigger],
+                                              cash[is_trigger], rewards["min_spend"][is_trigger]):
+            triggers.append((card_index[name], category_index[k], min_spend, amount))
+
+    min_scores = cards["min_score"] if "min_score" in cards else None
+
+    return CardCatalog(names, categories, rates.to_numpy(), cards["clean_annual_fee"].to_numpy(),
+                       min_scores, triggers)
+
+
+def as_catalog(cards, fees=None):
+    """
+    Accept either a ``CardCatalog`` or the legacy ``(cards, fees)`` dicts.
+    """
+    if isinstance(cards, CardCatalog):
+        return cards
+    return CardCatalog.from_dicts(cards, fees)
+
+
+def get_dicts(df):
+    """
     Parse a cleaned rewards dataset into structured dictionaries used by the
     optimization model.
 
+    This is an adapter over ``compile_catalog`` for code that still expects
+    nested dictionaries; the optimizer accepts the compiled catalog directly.
+
     For each card, this function extracts:
       - per-category cash-equivalent reward rates
       - trigger-based reward bonuses
@@ -101,45 +370,7 @@ def get_dicts(df):
         fees_dict : dict
             Mapping card -> annual fee.
     """
-    cards_dict = {}
-    fees_dict = {}
-
-    for _, row in df.iterrows():
-        card_name = row["name"]
-        issuer = row["issuer"]        # ADDED FOR ANGELA FRAMEWORK
-        fees_dict[card_name] = row["clean_annual_fee"]
-
-        rates = {}
-        triggers = {}
-
-        for reward in row["clean_rewards"]:
-            if not reward:
-                continue
-
-            value = reward[0]
-            rtype = reward[1]
-            unit = reward[2]             # "miles", "points", etc.
-            category = reward[3]         # direct category from  dataset
-
-            # issuer based conversion
-            conversion = get_conversion_rate(issuer, unit)
-            cash_rate = value * conversion
-
-            if rtype in ("Multiplier", "Per Unit", "Percentage"):
-                # keep best rate for this category
-                rates[category] = max(rates.get(category, 0), cash_rate)
-
-            elif rtype == "Trigger":
-                # placeholder for future
-                triggers.setdefault(category, []).append((row["min_spend"], cash_rate))
-
-        cards_dict[card_name] = {
-            "min_score": 0,
-            "rates": rates,
-            "triggers": triggers,
-        }
-
-    return cards_dict, fees_dict
+    return compile_catalog(df).to_dicts()
 
 
 def summarize(cats, chosen, spending, cards, trigger_bonus, fees, held):
@@ -263,7 +494,909 @@ def trigger_bonuses(card_list, cards, spending, cats):
             bonuses[(c, k)] = total_bonus
     return bonuses
 
-def optimize_cardspace(cards, fees, spending, score):
+# largest (cards x block x categories) comparison dominance_mask builds at once
+DOMINANCE_BLOCK_ELEMENTS = 1 << 22
+
+
+def dominance_mask(values, fee_vec, profitable=True):
+    """
+    Flag the rows of a value matrix that survive dominance pruning.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Reward values of shape (cards, categories).
+    fee_vec : np.ndarray
+        Annual fee per card.
+    profitable : bool
+        Also drop cards whose total value does not exceed their fee.
+        Defaults to True.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask, True for cards that may appear in an optimal wallet.
+    """
+    keep = values.sum(axis=1) > fee_vec if profitable else np.ones(len(fee_vec), dtype=bool)
+
+    # cards are checked against all others a block at a time, so memory is
+    # (cards x block x categories) instead of growing with cards squared
+    n = len(fee_vec)
+    block = max(1, DOMINANCE_BLOCK_ELEMENTS // max(n * values.shape[1], 1))
+    order = np.arange(n)
+    for start in range(0, n, block):
+        a = slice(start, start + block)
+        # dominates[b, a]: card b is at least as good as card a everywhere
+        at_least = (values[:, None, :] >= values[None, a, :]).all(axis=2) & (fee_vec[:, None] <= fee_vec[None, a])
+        strictly = (values[:, None, :] > values[None, a, :]).any(axis=2) | (fee_vec[:, None] < fee_vec[None, a])
+        dominates = at_least & (strictly | (order[:, None] < order[None, a]))
+        keep[a] &= ~dominates.any(axis=0)
+    return keep
+
+
+def prune_candidates(values, fee_vec, eligible):
+    """
+    Drop cards that can never appear in an optimal wallet.
+
+    A card is removed when:
+      - the user's score is below its minimum score
+      - its best possible reward at this spending (winning every category)
+        does not exceed its annual fee
+      - another card has a fee no higher and a reward value at least as high
+        in every category (exact duplicates keep the first card)
+
+    Dominance is checked on spend-weighted values, so categories with no
+    spending do not keep a card alive. Pruning never changes the optimal
+    total.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Reward values of shape (cards, categories).
+    fee_vec : np.ndarray
+        Annual fee per card.
+    eligible : np.ndarray
+        Boolean mask of the cards the user's score allows.
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        allowed : np.ndarray
+            Boolean mask of the remaining candidate cards.
+        removed : int
+            Number of cards that were pruned, ineligible ones included.
+    """
+    allowed = eligible.copy()
+    allowed[allowed] = dominance_mask(values[allowed], fee_vec[allowed])
+    removed = int(len(fee_vec) - allowed.sum())
+    logger.debug("pruned %d of %d candidate cards", removed, len(fee_vec))
+    return allowed, removed
+
+
+# Upper bound on the number of fee-card subsets the fast path is allowed to
+# enumerate before handing the problem to a MILP backend.
+MAX_ENUMERATED_SUBSETS = 50_000
+
+
+def best_assignment(values, fee_vec, max_subsets=MAX_ENUMERATED_SUBSETS):
+    """
+    Find the optimal category assignment of a value matrix by enumeration.
+
+    Free cards are always available. Every subset of fee cards that could
+    be held (at most one per category) is added on top of them and the
+    subset with the best net value wins.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Reward values of shape (cards, categories).
+    fee_vec : np.ndarray
+        Annual fee per card.
+    max_subsets : int
+        Largest number of fee-card subsets to enumerate.
+
+    Returns
+    -------
+    np.ndarray or None
+        Row index of the card assigned to each category (-1 if none), or
+        None if there are more than ``max_subsets`` subsets.
+    """
+    n_cats = values.shape[1]
+    paid = np.flatnonzero(fee_vec > 0)
+    free = np.flatnonzero(fee_vec <= 0)
+
+    # a held fee card must win at least one category, so at most |cats| of them
+    max_size = min(n_cats, paid.size)
+    if sum(math.comb(paid.size, r) for r in range(1, max_size + 1)) > max_subsets:
+        return None
+
+    base = values[free].max(axis=0) if free.size else np.zeros(n_cats)
+    best_value = base.sum()
+    best_subset = np.array([], dtype=int)
+
+    for r in range(1, max_size + 1):
+        combos = np.array(list(itertools.combinations(paid, r)), dtype=int)
+        covered = np.maximum(values[combos].max(axis=1), base)
+        totals = covered.sum(axis=1) - fee_vec[combos].sum(axis=1)
+        i = int(totals.argmax())
+        # strict improvement keeps the smallest wallet on ties
+        if totals[i] > best_value + 1e-9:
+            best_value = totals[i]
+            best_subset = combos[i]
+
+    pool = np.concatenate([free, best_subset])
+    assign = np.full(n_cats, -1, dtype=int)
+    if pool.size:
+        best = pool[values[pool].argmax(axis=0)]
+        assign = np.where(values[best, np.arange(n_cats)] > 0, best, -1)
+    return assign
+
+
+def expand_assignment(rows, sub):
+    """
+    Map an assignment over a subset of catalog rows back to catalog rows.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Catalog row of each card in the subset.
+    sub : np.ndarray
+        Subset row assigned to each category (-1 if none).
+
+    Returns
+    -------
+    np.ndarray
+        Catalog row assigned to each category (-1 if none).
+    """
+    assign = np.full(len(sub), -1, dtype=int)
+    assign[sub >= 0] = rows[sub[sub >= 0]]
+    return assign
+
+
+def build_solution(catalog, cats, spending, assign, values, bonus, held_mask=None):
+    """
+    Assemble the ``(chosen, total, held, breakdown)`` tuple for an
+    assignment over a compiled catalog.
+
+    Parameters
+    ----------
+    catalog : CardCatalog
+        Catalog the assignment refers to.
+    cats : list
+        Spending categories.
+    spending : dict
+        Annual spending by category.
+    assign : np.ndarray
+        Catalog row assigned to each category (-1 if none).
+    values : np.ndarray
+        Reward values of shape (cards, categories).
+    bonus : np.ndarray
+        Trigger bonus part of ``values``.
+    held_mask : np.ndarray, optional
+        Cards held by the solution. Defaults to the assigned cards.
+
+    Returns
+    -------
+    Tuple
+        Same tuple as ``optimize_cardspace``.
+    """
+    fee_vec = catalog.fees.astype(float)
+    chosen, total, held = read_assignment(catalog.names, cats, assign, values, fee_vec, held_mask)
+
+    rates = catalog.rates_for(cats)
+    cards = {catalog.names[i]: {"rates": {}} for i in assign if i >= 0}
+    trigger_bonus = {}
+    for j, (k, i) in enumerate(zip(cats, assign)):
+        if i >= 0:
+            cards[catalog.names[i]]["rates"][k] = float(rates[i, j])
+            trigger_bonus[(catalog.names[i], k)] = float(bonus[i, j])
+    fees = {c: float(catalog.fees[catalog.card_index[c]]) for c in held}
+
+    breakdown = summarize(cats, chosen, spending, cards, trigger_bonus, fees, held)
+    return chosen, total, held, breakdown
+
+
+def profile_arrays(catalog, spending):
+    """
+    Reward values and trigger bonuses of one spending profile.
+
+    Returns
+    -------
+    Tuple[list, np.ndarray, np.ndarray]
+        Categories, values and bonuses, each array of shape
+        (cards, categories).
+    """
+    cats = list(spending.keys())
+    spend = np.array([[spending[k] for k in cats]], dtype=float).reshape(1, len(cats))
+    values, bonus = catalog.values(spend, cats)
+    return cats, values[0], bonus[0]
+
+
+def wallet_still_optimal(old_values, new_values, assign, allowed):
+    """
+    Check whether an optimal assignment stays optimal after the reward
+    values change, without solving.
+
+    Any other wallet can gain at most ``max(0, max_c delta[c, k])`` in each
+    category relative to its old value, which was no better than the old
+    optimum. If the currently assigned card gains at least that much in
+    every category, no wallet can overtake the current one.
+
+    Parameters
+    ----------
+    old_values : np.ndarray
+        Reward values the assignment was optimal for, (cards, categories).
+    new_values : np.ndarray
+        Reward values after the spending change.
+    assign : np.ndarray
+        Catalog row assigned to each category (-1 if none).
+    allowed : np.ndarray
+        Boolean mask of cards that may be held.
+
+    Returns
+    -------
+    bool
+        True if the assignment is guaranteed to still be optimal.
+    """
+    delta = new_values - old_values
+    current = np.where(assign >= 0, delta[np.maximum(assign, 0), np.arange(len(assign))], 0.0)
+    best = delta[allowed].max(axis=0) if allowed.any() else np.zeros(len(assign))
+    return bool(np.all(current >= np.maximum(best, 0.0) - 1e-9))
+
+
+def wallet_lines(values, rates, bonus, fee_vec, j, paid, free, max_subsets):
+    """
+    Value of every candidate wallet as lines in the spending of category j.
+
+    Free cards are always available; every subset of the ``paid`` rows of
+    size at most the number of categories is a wallet. Category j is
+    covered by whichever of the wallet's cards earns most at spend ``t``,
+    or left uncovered, so a wallet's value is the maximum of one line
+    ``intercept + t * slope`` per card it holds. With trigger bonuses a
+    different card can take over as ``t`` grows, so every (wallet, card)
+    line is returned; their upper envelope is the optimal value.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray] or None
+        Intercepts and slopes, one per (wallet, card) pair plus one
+        uncovered line per wallet, or None if there are more than
+        ``max_subsets`` wallets.
+    """
+    n_cats = values.shape[1]
+    others = np.arange(n_cats) != j
+    max_size = min(n_cats, paid.size)
+    if sum(math.comb(paid.size, r) for r in range(1, max_size + 1)) > max_subsets:
+        return None
+
+    base = values[free].max(axis=0) if free.size else np.zeros(n_cats)
+
+    intercepts, slopes = [], []
+    for r in range(0, max_size + 1):
+        if r:
+            combos = np.array(list(itertools.combinations(paid, r)), dtype=int)
+        else:
+            combos = np.zeros((1, 0), dtype=int)
+        covered = np.maximum(values[combos].max(axis=1), base) if r else base[None, :]
+        rest = covered[:, others].sum(axis=1) - fee_vec[combos].sum(axis=1)
+
+        cards = np.concatenate([combos, np.broadcast_to(free, (len(combos), free.size))], axis=1)
+        intercepts += [(rest[:, None] + bonus[cards, j]).ravel(), rest]
+        slopes += [rates[cards, j].ravel(), np.zeros(len(combos))]
+    return np.concatenate(intercepts), np.concatenate(slopes)
+
+
+def upper_envelope(intercepts, slopes):
+    """
+    Upper envelope of a few lines over ``t >= 0``.
+
+    Returns
+    -------
+    list
+        ``(start, end, intercept, slope)`` per segment, left to right; the
+        last segment ends at ``inf``.
+    """
+    intercepts = np.asarray(intercepts, dtype=float)
+    slopes = np.asarray(slopes, dtype=float)
+    i = int(np.lexsort((-slopes, -intercepts))[0])
+    start = 0.0
+    segments = []
+    while True:
+        steeper = np.flatnonzero(slopes > slopes[i] + 1e-12)
+        if not steeper.size:
+            segments.append((start, np.inf, intercepts[i], slopes[i]))
+            return segments
+        cross = np.maximum((intercepts[i] - intercepts[steeper]) / (slopes[steeper] - slopes[i]), start)
+        # at a shared crossing the steepest line takes over
+        first = np.lexsort((-slopes[steeper], cross))[0]
+        nxt, end = steeper[first], float(cross[first])
+        if end > start:
+            segments.append((start, end, intercepts[i], slopes[i]))
+        i, start = nxt, end
+
+
+def sensitivity_analysis(catalog, spending, score, assign, held_mask=None, max_subsets=MAX_ENUMERATED_SUBSETS):
+    """
+    Spending ranges over which a solution stays optimal, and the break-even
+    spend of each fee card, computed from the rate matrix without solving.
+
+    For each category the optimal value as a function of that category's
+    spend (all others fixed) is the upper envelope of one line per wallet
+    and card it holds (see ``wallet_lines``). The current wallet (its fee
+    cards, with every free card available) stays optimal until another
+    wallet's line rises above its own envelope. Cards that are dominated
+    for every spend level are left out of the enumeration, since they can
+    never be on the envelope. Trigger bonuses are held at their current
+    values, so ranges are also clipped to the nearest trigger threshold.
+
+    The break-even spend of fee card c in category k is the spend in k at
+    which c's extra rewards over the rest of the current wallet (other
+    spending unchanged) pay for its fee.
+
+    Parameters
+    ----------
+    catalog : CardCatalog
+        Catalog the solution was computed on.
+    spending : dict
+        Annual spending by category.
+    score : int
+        User's credit score.
+    assign : np.ndarray
+        Catalog row assigned to each category (-1 if none).
+    held_mask : np.ndarray, optional
+        Cards held by the solution. Defaults to the assigned cards.
+    max_subsets : int
+        Largest number of wallets to enumerate per category.
+
+    Returns
+    -------
+    dict
+        ranges : dict
+            Mapping category -> (low, high) annual spend, ``high`` may be
+            ``inf``; None if the category has too many wallets to enumerate.
+        break_even : dict
+            Mapping fee card -> {category: annual spend}, for categories in
+            which the card earns more than the rest of the wallet.
+    """
+    cats, values, bonus = profile_arrays(catalog, spending)
+    rates = catalog.rates_for(cats)
+    fee_vec = catalog.fees.astype(float)
+    eligible = catalog.eligible(score)
+    spend = np.array([spending[k] for k in cats], dtype=float)
+
+    if held_mask is None:
+        held_mask = np.zeros(len(catalog), dtype=bool)
+        held_mask[assign[assign >= 0]] = True
+    wallet_paid = np.flatnonzero(held_mask & (fee_vec > 0))
+    all_free = np.flatnonzero(eligible & (fee_vec <= 0))
+
+    thresholds = {}
+    for row, col, min_spend, _ in catalog.triggers:
+        k = catalog.categories[col]
+        if eligible[row] and k in spending:
+            thresholds.setdefault(k, []).append(min_spend)
+
+    # how far another wallet has to rise above the current one to count
+    eps = 1e-6
+    ranges = {}
+    for j, k in enumerate(cats):
+        # rates and bonuses instead of values in column j keep the pruning
+        # valid for every spend in k
+        scaled = np.column_stack([values, bonus[:, j]])
+        scaled[:, j] = rates[:, j]
+        candidates = eligible.copy()
+        candidates[candidates] = dominance_mask(scaled[candidates], fee_vec[candidates], profitable=False)
+
+        paid = np.flatnonzero(candidates & (fee_vec > 0))
+        free = np.flatnonzero(candidates & (fee_vec <= 0))
+        lines = wallet_lines(values, rates, bonus, fee_vec, j, paid, free, max_subsets)
+        if lines is None:
+            ranges[k] = None
+            continue
+        intercepts, slopes = lines
+
+        own_intercepts, own_slopes = wallet_lines(values, rates, bonus, fee_vec, j, np.array([], dtype=int),
+                                                  np.concatenate([all_free, wallet_paid]), max_subsets)
+        own = upper_envelope(own_intercepts - fee_vec[wallet_paid].sum(), own_slopes)
+
+        # walk the current wallet's envelope away from the current spend
+        # until some line rises above it
+        high = np.inf
+        for start, end, a, b in own:
+            if end <= spend[j]:
+                continue
+            steeper = slopes > b + 1e-12
+            cross = (a + eps - intercepts[steeper]) / (slopes[steeper] - b)
+            cross = cross[cross < end]
+            if cross.size:
+                high = max(cross.min(), start, spend[j])
+                break
+        low = 0.0
+        for start, end, a, b in reversed(own):
+            if start >= spend[j]:
+                continue
+            flatter = slopes < b - 1e-12
+            cross = (intercepts[flatter] - a - eps) / (b - slopes[flatter])
+            cross = cross[cross > start]
+            if cross.size:
+                low = min(cross.max(), end, spend[j])
+                break
+
+        for t in thresholds.get(k, []):
+            if t > spend[j]:
+                high = min(high, t)
+            else:
+                low = max(low, t)
+
+        ranges[k] = (float(min(max(low, 0.0), spend[j])), float(max(high, spend[j])))
+
+    break_even = {}
+    for c in np.flatnonzero(eligible & (fee_vec > 0)):
+        rest = np.concatenate([all_free, wallet_paid[wallet_paid != c]])
+        best_rest = values[rest].max(axis=0) if rest.size else np.zeros(len(cats))
+        gains = np.maximum(values[c] - best_rest, 0.0)
+        for j, k in enumerate(cats):
+            # c must beat every card left in the wallet, and leaving k uncovered
+            rest_bonus = np.append(bonus[rest, j], 0.0)
+            rest_rate = np.append(rates[rest, j], 0.0)
+            if rates[c, j] <= rest_rate.max():
+                continue
+            needed = fee_vec[c] - (gains.sum() - gains[j]) - (bonus[c, j] - rest_bonus)
+            spend_needed = (needed / (rates[c, j] - rest_rate)).max()
+            break_even.setdefault(catalog.names[c], {})[k] = float(max(spend_needed, 0.0))
+
+    return {"ranges": ranges, "break_even": break_even}
+
+
+def evaluate_wallet(catalog, chosen, spending):
+    """
+    Price a fixed category -> card assignment at a given spending.
+
+    No optimization is done; this is used to re-evaluate a known wallet
+    when spending changes slightly.
+
+    Parameters
+    ----------
+    catalog : CardCatalog
+        Catalog containing every card in ``chosen``.
+    chosen : dict
+        Mapping category -> card (or None).
+    spending : dict
+        Annual spending by category.
+
+    Returns
+    -------
+    Tuple
+        Same ``(chosen, total, held, breakdown)`` tuple as
+        ``optimize_cardspace``.
+    """
+    cats, values, bonus = profile_arrays(catalog, spending)
+    assign = np.array(
+        [catalog.card_index[chosen[k]] if chosen.get(k) is not None else -1 for k in cats],
+        dtype=int,
+    )
+    return build_solution(catalog, cats, spending, assign, values, bonus)
+
+
+def read_assignment(card_list, cats, assign, values, fee_vec, held_mask=None):
+    """
+    Turn an assignment array into the ``chosen``, ``total`` and ``held``
+    values returned by the solvers.
+
+    Parameters
+    ----------
+    card_list : list
+        Cards matching the rows of ``values``.
+    cats : list
+        Categories matching the columns of ``values``.
+    assign : np.ndarray
+        Row index of the card assigned to each category (-1 if none).
+    values : np.ndarray
+        Reward values of shape (cards, categories).
+    fee_vec : np.ndarray
+        Annual fee per card.
+    held_mask : np.ndarray, optional
+        Cards held by the solution. Defaults to the assigned cards.
+
+    Returns
+    -------
+    Tuple[dict, float, set]
+        Category -> card mapping, net annual reward and held cards.
+    """
+    chosen = {k: (card_list[i] if i >= 0 else None) for k, i in zip(cats, assign)}
+
+    if held_mask is None:
+        held_idx = np.unique(assign[assign >= 0])
+    else:
+        held_idx = np.flatnonzero(held_mask)
+
+    assigned = np.flatnonzero(assign >= 0)
+    total = float(values[assign[assigned], assigned].sum() - fee_vec[held_idx].sum())
+    held = {card_list[i] for i in held_idx}
+    return chosen, total, held
+
+
+class CardspaceModel:
+    """
+    Reusable PuLP formulation of the card selection problem.
+
+    Variables and constraints are built once for a fixed list of cards and
+    categories. Each solve only replaces the objective and the upper bounds
+    of the hold variables, so many spending profiles can share one model.
+
+    Constraints enforce:
+      - at most one card per spending category
+      - cards can only be used if held
+      - held cards must be used in at least one category
+      - cards can only be held if allowed (eligible and not pruned)
+    """
+
+    def __init__(self, card_list, cats):
+        import pulp
+
+        self.card_list = list(card_list)
+        self.cats = list(cats)
+        self.prob = pulp.LpProblem("Maximize_Rewards", pulp.LpMaximize)
+
+        n_cards, n_cats = len(self.card_list), len(self.cats)
+
+        #card selection indicator
+        self.y = [pulp.LpVariable(f"hold_{i}", 0, 1, pulp.LpBinary) for i in range(n_cards)]
+
+        #category decision
+        self.x = [[pulp.LpVariable(f"use_{i}_{j}", 0, 1, pulp.LpBinary) for j in range(n_cats)]
+                  for i in range(n_cards)]
+
+        #at most one card per category
+        for j in range(n_cats):
+            self.prob += pulp.lpSum(self.x[i][j] for i in range(n_cards)) <= 1
+
+        for i in range(n_cards):
+            #can only use a card if you hold it
+            for j in range(n_cats):
+                self.prob += self.x[i][j] <= self.y[i]
+            # If a card is held, it must be used in at least one category. (Avoids treating 0 fee cards as free)
+            self.prob += pulp.lpSum(self.x[i]) >= self.y[i]
+
+        self._allowed = None
+
+    def solve(self, values, fee_vec, allowed, start=None, changed=None):
+        """
+        Solve the model for one spending profile.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Reward values of shape (cards, categories).
+        fee_vec : np.ndarray
+            Annual fee per card.
+        allowed : np.ndarray
+            Boolean mask of cards that may be held.
+        start : Tuple[np.ndarray, np.ndarray], optional
+            Previous ``(assign, held_mask)``. Accepted for the same signature
+            as ``HighsCardspaceModel.solve`` but not given to CBC.
+        changed : list, optional
+            Category columns whose values changed since the last solve. When
+            given and ``allowed`` is unchanged, only those objective
+            coefficients are updated.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray] or None
+            Assignment array (-1 for unassigned categories) and held mask,
+            or None if no optimal solution was found.
+        """
+        import pulp
+
+        rows = np.flatnonzero(allowed)
+        if not len(rows):
+            # an empty objective makes PuLP add a dummy column to the shared
+            # problem, which breaks every later solve on this model
+            return np.full(len(self.cats), -1, dtype=int), np.zeros(len(self.card_list), dtype=bool)
+
+        if changed is not None and self._allowed is not None and np.array_equal(self._allowed, allowed):
+            for j in changed:
+                for i in rows:
+                    self.prob.objective[self.x[i][j]] = float(values[i, j])
+        else:
+            for y_i, ok in zip(self.y, allowed):
+                y_i.upBound = 1 if ok else 0
+
+            #objective: rewards - fees
+            reward = pulp.lpSum(float(values[i, j]) * self.x[i][j] for i in rows for j in range(len(self.cats)))
+            fee = pulp.lpSum(float(fee_vec[i]) * self.y[i] for i in rows)
+            self.prob.setObjective(reward - fee)
+            self._allowed = np.array(allowed, dtype=bool)
+
+        # ``start`` is not passed on: CBC 2.10 can return a worse wallet from
+        # a MIP start and still report it as optimal
+        self.prob.solve(pulp.PULP_CBC_CMD(msg=False))
+        if pulp.LpStatus[self.prob.status] != "Optimal":
+            return None
+
+        assign = np.full(len(self.cats), -1, dtype=int)
+        for j in range(len(self.cats)):
+            picked = [i for i in rows if pulp.value(self.x[i][j]) > 0.5]
+            if picked:
+                assign[j] = picked[0]
+        held_mask = np.array([pulp.value(y_i) > 0.5 for y_i in self.y], dtype=bool)
+        return assign, held_mask
+
+
+class HighsCardspaceModel:
+    """
+    In-process HiGHS version of ``CardspaceModel``.
+
+    The model lives in one ``highspy.Highs`` instance. Each solve updates the
+    column costs and hold-variable bounds in place, so no LP files are
+    written and no solver process is started.
+
+    Columns are laid out as the hold variables ``y_i`` followed by the
+    category decisions ``x_ij`` in row-major order.
+    """
+
+    def __init__(self, card_list, cats):
+        import highspy
+
+        self.card_list = list(card_list)
+        self.cats = list(cats)
+        n_cards, n_cats = len(self.card_list), len(self.cats)
+        n_cols = n_cards + n_cards * n_cats
+
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue("output_flag", False)
+
+        zeros = np.zeros(n_cols)
+        self.highs.addCols(n_cols, zeros, zeros, np.ones(n_cols), 0,
+                           np.zeros(n_cols, dtype=np.int32), np.array([], dtype=np.int32), np.array([]))
+        self.highs.changeColsIntegrality(n_cols, np.arange(n_cols, dtype=np.int32),
+                                         np.array([highspy.HighsVarType.kInteger] * n_cols))
+        self.highs.changeObjectiveSense(highspy.ObjSense.kMaximize)
+
+        def x(i, j):
+            return n_cards + i * n_cats + j
+
+        rows = []
+        #at most one card per category
+        for j in range(n_cats):
+            rows.append((-highspy.kHighsInf, 1.0, [x(i, j) for i in range(n_cards)], [1.0] * n_cards))
+        for i in range(n_cards):
+            #can only use a card if you hold it
+            for j in range(n_cats):
+                rows.append((-highspy.kHighsInf, 0.0, [x(i, j), i], [1.0, -1.0]))
+            # If a card is held, it must be used in at least one category.
+            rows.append((0.0, highspy.kHighsInf, [x(i, j) for j in range(n_cats)] + [i], [1.0] * n_cats + [-1.0]))
+
+        if rows:
+            lower, upper, indices, coefs = zip(*rows)
+            starts = np.cumsum([0] + [len(ix) for ix in indices[:-1]]).astype(np.int32)
+            flat_indices = np.array([c for ix in indices for c in ix], dtype=np.int32)
+            flat_coefs = np.array([v for cs in coefs for v in cs], dtype=float)
+            self.highs.addRows(len(rows), np.array(lower), np.array(upper), len(flat_indices),
+                               starts, flat_indices, flat_coefs)
+
+        self._allowed = None
+
+    def solve(self, values, fee_vec, allowed, start=None, changed=None):
+        """
+        Solve the model for one spending profile.
+
+        Takes and returns the same arguments as ``CardspaceModel.solve``.
+        """
+        import highspy
+
+        n_cards, n_cats = len(self.card_list), len(self.cats)
+        n_cols = n_cards + n_cards * n_cats
+        values = np.asarray(values, dtype=float)
+
+        if changed is not None and self._allowed is not None and np.array_equal(self._allowed, allowed):
+            # only the columns of the changed categories
+            cols = np.array([n_cards + i * n_cats + j for j in changed for i in range(n_cards)], dtype=np.int32)
+            costs = np.concatenate([values[:, j] for j in changed]) if len(changed) else np.array([])
+            self.highs.changeColsCost(len(cols), cols, costs)
+        else:
+            cols = np.arange(n_cols, dtype=np.int32)
+
+            #objective: rewards - fees
+            costs = np.concatenate([-np.asarray(fee_vec, dtype=float), values.ravel()])
+            self.highs.changeColsCost(n_cols, cols, costs)
+
+            upper = np.ones(n_cols)
+            upper[:n_cards] = np.asarray(allowed, dtype=float)
+            self.highs.changeColsBounds(n_cols, cols, np.zeros(n_cols), upper)
+            self._allowed = np.array(allowed, dtype=bool)
+
+        if start is not None:
+            assign, held_mask = start
+            used = np.zeros((n_cards, n_cats))
+            used[assign[assign >= 0], np.flatnonzero(assign >= 0)] = 1.0
+            solution = highspy.HighsSolution()
+            solution.col_value = list(np.concatenate([np.asarray(held_mask, dtype=float), used.ravel()]))
+            self.highs.setSolution(solution)
+
+        self.highs.run()
+        if self.highs.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            return None
+
+        solution = np.asarray(self.highs.getSolution().col_value)
+        held_mask = solution[:n_cards] > 0.5
+        used = solution[n_cards:].reshape(n_cards, n_cats) > 0.5
+        assign = np.where(used.any(axis=0), used.argmax(axis=0), -1)
+        return assign, held_mask
+
+
+class SolverBackend:
+    """
+    Base class of the solver backends used by ``optimize_cardspace``.
+
+    A backend receives the compiled catalog, the reward values for one
+    profile and the mask of cards that may be held, and returns the
+    assignment (catalog row per category, -1 if none) with an optional held
+    mask, or None when it cannot solve the problem.
+    """
+
+    name = None
+
+    def solve(self, catalog, cats, values, fee_vec, allowed):
+        raise NotImplementedError
+
+
+class FastPathBackend(SolverBackend):
+    """
+    Pure-Python backend built on ``best_assignment``. Declines problems with
+    more than ``max_subsets`` fee-card subsets.
+    """
+
+    name = "fast"
+
+    def __init__(self, max_subsets=MAX_ENUMERATED_SUBSETS):
+        self.max_subsets = max_subsets
+
+    def solve(self, catalog, cats, values, fee_vec, allowed):
+        rows = np.flatnonzero(allowed)
+        sub = best_assignment(values[rows], fee_vec[rows], self.max_subsets)
+        if sub is None:
+            return None
+        return expand_assignment(rows, sub), None
+
+
+class WarmModelBackend(SolverBackend):
+    """
+    MILP backend that keeps one model per (catalog, categories) and only
+    updates its objective between solves.
+
+    Models are held in a ``WeakKeyDictionary`` so they are dropped together
+    with their catalog. Each model has its own lock because solver threads
+    may share a catalog.
+    """
+
+    model_cls = None
+
+    def __init__(self):
+        self._models = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def model(self, catalog, cats):
+        with self._lock:
+            models = self._models.setdefault(catalog, {})
+            key = tuple(cats)
+            if key not in models:
+                models[key] = (self.model_cls(catalog.names, cats), threading.Lock())
+            return models[key]
+
+    def solve(self, catalog, cats, values, fee_vec, allowed):
+        model, lock = self.model(catalog, cats)
+        with lock:
+            return model.solve(values, fee_vec, allowed)
+
+
+class CbcBackend(WarmModelBackend):
+    """
+    PuLP model solved by the CBC binary (one subprocess per solve).
+    """
+
+    name = "cbc"
+    model_cls = CardspaceModel
+
+
+class HighsBackend(WarmModelBackend):
+    """
+    HiGHS model solved in-process through highspy.
+    """
+
+    name = "highs"
+    model_cls = HighsCardspaceModel
+
+
+BACKENDS = {backend.name: backend for backend in (FastPathBackend(), CbcBackend(), HighsBackend())}
+
+# "auto" uses HiGHS when highspy is installed and CBC otherwise
+SOLVER_BACKEND = os.environ.get("SOLVER_BACKEND", "auto")
+
+_backend_timings = {name: {"calls": 0, "solved": 0, "failed": 0, "seconds": 0.0, "max_seconds": 0.0} for name in BACKENDS}
+_timings_lock = threading.Lock()
+
+
+def backend_chain(backend=None, fast_path=True):
+    """
+    Names of the backends to try, in order.
+
+    Parameters
+    ----------
+    backend : str, optional
+        "auto", "fast", "cbc" or "highs". Defaults to ``SOLVER_BACKEND``.
+    fast_path : bool
+        Try the fast path before the MILP backend.
+
+    Returns
+    -------
+    list
+        Backend names; the last one is always a MILP backend.
+    """
+    backend = backend or SOLVER_BACKEND
+    if backend not in ("auto", *BACKENDS):
+        raise ValueError(f"unknown solver backend: {backend}")
+
+    milp = backend if backend in ("cbc", "highs") else ("highs" if HAVE_HIGHSPY else "cbc")
+    if milp == "highs" and not HAVE_HIGHSPY:
+        raise ImportError("the highs backend requires highspy")
+
+    if fast_path or backend == "fast":
+        return ["fast", milp]
+    return [milp]
+
+
+def run_backends(catalog, cats, values, fee_vec, allowed, chain):
+    """
+    Try each backend in ``chain`` until one returns a solution, recording
+    per-backend timings.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray] or None
+        Assignment and held mask (None means the assigned cards), or None
+        if the last backend found no optimal solution.
+    """
+    result = None
+    for name in chain:
+        result = None
+        failed = True
+        start = time.perf_counter()
+        try:
+            result = BACKENDS[name].solve(catalog, cats, values, fee_vec, allowed)
+            failed = False
+        finally:
+            # a backend that raised still spent the time
+            elapsed = time.perf_counter() - start
+            with _timings_lock:
+                timing = _backend_timings[name]
+                timing["calls"] += 1
+                timing["solved"] += result is not None
+                timing["failed"] += failed
+                timing["seconds"] += elapsed
+                timing["max_seconds"] = max(timing["max_seconds"], elapsed)
+
+        if result is not None:
+            break
+    return result
+
+
+def backend_stats():
+    """
+    Per-backend call counts and timings.
+
+    Returns
+    -------
+    dict
+        Mapping backend name -> ``calls``, ``solved``, ``failed`` (raised an
+        exception), ``seconds`` and ``max_seconds``.
+    """
+    with _timings_lock:
+        return {name: dict(timing) for name, timing in _backend_timings.items()}
+
+
+def optimize_cardspace(cards, fees, spending, score, fast_path=True, prune=True, backend=None,
+                       with_sensitivity=False):
     """
     Solve the credit card portfolio and spending allocation problem.
 
@@ -271,24 +1404,34 @@ def optimize_cardspace(cards, fees, spending, score):
     selects an optimal subset of credit cards and assigns each spending
     category to at most one card in order to maximize net annual rewards.
     Rewards include base category multipliers and precomputed trigger bonuses,
-    minus annual card fees.
+    minus annual card fees. See ``CardspaceModel`` for the constraints.
 
-    Constraints enforce:
-      - at most one card per spending category
-      - cards can only be used if held
-      - held cards must be used in at least one category
-      - eligibility based on minimum credit score
+    The problem is handed to a chain of solver backends: the pure-Python
+    fast path first (unless disabled), then a warm CBC or HiGHS model.
 
     Parameters
     ----------
-    cards : dict
-        Mapping card -> reward structure and eligibility data.
-    fees : dict
-        Mapping card -> annual fee.
+    cards : CardCatalog or dict
+        Compiled catalog from ``compile_catalog``, or mapping card ->
+        reward structure and eligibility data.
+    fees : dict or None
+        Mapping card -> annual fee. Ignored for a compiled catalog.
     spending : dict
         Annual spending by category.
     score : int
         User's credit score.
+    fast_path : bool
+        Try ``best_assignment`` first and only build the MILP when the
+        problem is too large to enumerate. Defaults to True.
+    prune : bool
+        Remove dominated and unprofitable cards (see ``prune_candidates``)
+        before solving. Defaults to True.
+    backend : str, optional
+        Solver backend, "auto", "fast", "cbc" or "highs" (see
+        ``backend_chain``). Defaults to ``SOLVER_BACKEND``.
+    with_sensitivity : bool
+        Also return the result of ``sensitivity_analysis`` as a fifth
+        element. Defaults to False.
 
     Returns
     -------
@@ -301,64 +1444,116 @@ def optimize_cardspace(cards, fees, spending, score):
             Set of cards selected by the model.
         breakdown : dict
             Per-category reward breakdown for the solution.
+        sensitivity : dict
+            Only with ``with_sensitivity``: optimality ranges per category
+            and break-even spends per fee card.
     """
-    prob = pulp.LpProblem("Maximize_Rewards", pulp.LpMaximize)
-    cats = list(spending.keys())
-    card_list = list(cards.keys())
+    catalog = as_catalog(cards, fees)
+    cats, values, bonus = profile_arrays(catalog, spending)
+    fee_vec = catalog.fees.astype(float)
 
     #eligibility filter from score
-    eligible = {c: 1 if score >= cards[c].get("min_score", 0) else 0 for c in card_list}
-
-    #decision vars
-
-        #card selection indicator
-    y = {c: pulp.LpVariable(f"hold_{c}", 0, 1, pulp.LpBinary) for c in card_list}
-
-        #category decision 
-    x = {(c,k): pulp.LpVariable(f"use_{c}_{k}", 0, 1, pulp.LpBinary)
-         for c in card_list for k in cats}
-
-    # Precompute trigger bonuses per (card, category)
-    # If spending in k exceeds min_spend for a trigger, include its bonus.
-    trigger_bonus = trigger_bonuses(card_list, cards, spending, cats)
+    allowed = catalog.eligible(score)
+    if prune:
+        allowed, _ = prune_candidates(values, fee_vec, allowed)
 
+    result = run_backends(catalog, cats, values, fee_vec, allowed, backend_chain(backend, fast_path))
+    #corrected optimality check
+    if result is None:
+        return None, 0.0, set(), {}, {}
 
-    #objective: rewards - fees
-    reward = pulp.lpSum((spending[k] * cards[c]["rates"].get(k, 0.0) + trigger_bonus[(c, k)]) * x[(c,k)] 
-                        for c in card_list for k in cats)
-    fee = pulp.lpSum(fees[c] * y[c] for c in card_list)
-    prob += reward - fee
-
-    #at most one card per category
-    for k in cats:
-        prob += pulp.lpSum(x[(c,k)] for c in card_list) <= 1
-
-    #can only use a card if you hold it
-    for c in card_list:
-        for k in cats:
-            prob += x[(c,k)] <= y[c]
-            
-
-    for c in card_list:
-        #can only hold if eligible by score
-        prob += y[c] <= eligible[c]
-        # If a card is held, it must be used in at least one category. (Avoids treating 0 fee cards as free)
-        prob += pulp.lpSum(x[(c,k)] for k in cats) >= y[c]
+    assign, held_mask = result
+    solution = build_solution(catalog, cats, spending, assign, values, bonus, held_mask)
+    if with_sensitivity:
+        return (*solution, sensitivity_analysis(catalog, spending, score, assign, held_mask))
+    return solution
 
 
-    prob.solve(pulp.PULP_CBC_CMD(msg=False))
-    #corrected optimality check
-    if pulp.LpStatus[prob.status] != "Optimal":
-        return None, 0.0, set(), {}, {}
+def optimize_batch(cards, fees, profiles, scores, chunk_size=1024, max_subsets=MAX_ENUMERATED_SUBSETS,
+                   backend=None):
+    """
+    Solve many spending profiles against one card catalog.
 
-    total = pulp.value(reward - fee)
-    chosen = {} #realized if all x[(c,k)] = 0 itll just choose the first card.
-    for k in cats:
-        picked = [c for c in card_list if pulp.value(x[(c,k)]) > 0.5]
-        chosen[k] = picked[0] if picked else None
+    The catalog is compiled once for the whole batch. Reward values are
+    computed for a chunk of profiles at a time; profiles with no eligible
+    fee card are solved with a single vectorized argmax, the rest are pruned
+    and enumerated per profile, and anything too large to enumerate is
+    solved with the warm model of the MILP backend, whose objective is
+    updated in place.
 
-    held   = {c for c in card_list if pulp.value(y[c]) > 0.5}
-    
-    breakdown = summarize(cats, chosen, spending, cards, trigger_bonus, fees, held)
-    return chosen, total, held, breakdown
+    Parameters
+    ----------
+    cards : CardCatalog or dict
+        Compiled catalog, or mapping card -> reward structure and
+        eligibility data.
+    fees : dict or None
+        Mapping card -> annual fee. Ignored for a compiled catalog.
+    profiles : pd.DataFrame or list
+        Annual spending by category, one row (or dict) per profile. Missing
+        categories count as zero spend.
+    scores : int or sequence
+        Credit score of every profile, or one score shared by all.
+    chunk_size : int
+        Number of profiles whose value matrices are built at once.
+    max_subsets : int
+        Largest number of fee-card subsets to enumerate before using the MILP.
+    backend : str, optional
+        MILP backend, "auto", "cbc" or "highs". Defaults to
+        ``SOLVER_BACKEND``.
 
+    Returns
+    -------
+    pd.DataFrame
+        One row per profile (same index as ``profiles`` when it is a
+        DataFrame) with columns ``chosen``, ``total``, ``held``,
+        ``breakdown`` and ``method`` ("closed_form" or "milp").
+    """
+    import pandas as pd
+
+    catalog = as_catalog(cards, fees)
+    frame = pd.DataFrame(profiles).fillna(0.0)
+    cats = list(frame.columns)
+    spend = frame.to_numpy(dtype=float)
+    n_profiles = len(frame)
+    score_vec = np.broadcast_to(np.asarray(scores, dtype=float), (n_profiles,))
+    fee_vec = catalog.fees.astype(float)
+    milp = backend_chain(backend, fast_path=False)
+
+    rows = []
+    for start in range(0, n_profiles, chunk_size):
+        chunk = spend[start:start + chunk_size]
+        values, bonus = catalog.values(chunk, cats)
+
+        eligible = score_vec[start:start + chunk_size, None] >= catalog.min_scores[None, :]
+        fee_free = ~(eligible & (fee_vec > 0)[None, :]).any(axis=1)
+
+        # fee-free profiles: best eligible card per category
+        masked = np.where(eligible[:, :, None], values, -np.inf)
+        best = masked.argmax(axis=1) if len(catalog) else np.zeros((len(chunk), len(cats)), dtype=int)
+
+        for p in range(len(chunk)):
+            method = "closed_form"
+            held_mask = None
+            if fee_free[p] and not len(catalog):
+                assign = np.full(len(cats), -1, dtype=int)
+            elif fee_free[p]:
+                assign = np.where(masked[p, best[p], np.arange(len(cats))] > 0, best[p], -1)
+            else:
+                allowed, _ = prune_candidates(values[p], fee_vec, eligible[p])
+                kept = np.flatnonzero(allowed)
+                sub = best_assignment(values[p][kept], fee_vec[kept], max_subsets)
+                if sub is not None:
+                    assign = expand_assignment(kept, sub)
+                else:
+                    method = "milp"
+                    result = run_backends(catalog, cats, values[p], fee_vec, allowed, milp)
+                    if result is None:
+                        rows.append((None, 0.0, set(), {}, method))
+                        continue
+                    assign, held_mask = result
+
+            spending = dict(zip(cats, chunk[p].tolist()))
+            rows.append((*build_solution(catalog, cats, spending, assign, values[p], bonus[p], held_mask), method))
+
+    return pd.DataFrame(rows, columns=["chosen", "total", "held", "breakdown", "method"],
+                        index=frame.index)
@@ -0,0 +1,115 @@
+"""
+Bounded worker pool for running solves off the NiceGUI event loop.
+
+``optimize_cardspace`` can block on the CBC subprocess. Running it on the
+event loop freezes every connected client, so the front end hands solves to
+this pool and awaits the result instead.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SolverBusy(RuntimeError):
+    """
+    Raised when the pool already has ``max_pending`` solves queued or running.
+    """
+
+
+class SolverPool:
+    """
+    Thread pool with a queue-depth limit and per-request timeout.
+
+    Threads rather than processes: CBC already solves in its own subprocess,
+    and the callers hand over state that only lives in this process (the
+    shared solution cache, each client's ``IncrementalSession``).
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker threads.
+    max_pending : int
+        Maximum number of solves queued or running at once. Further requests
+        raise ``SolverBusy`` immediately.
+    timeout : float, optional
+        Seconds to wait for a result before raising ``TimeoutError``. None
+        waits forever.
+    """
+
+    def __init__(self, max_workers=4, max_pending=16, timeout=30.0):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def _release(self, _future):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    async def run(self, fn, *args):
+        """
+        Run ``fn(*args)`` in the pool and await its result.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to run, e.g. ``optimize_cardspace``.
+        *args
+            Positional arguments for ``fn``.
+
+        Returns
+        -------
+        object
+            Whatever ``fn`` returns.
+
+        Raises
+        ------
+        SolverBusy
+            If ``max_pending`` solves are already queued or running.
+        TimeoutError
+            If no result arrived within ``timeout`` seconds.
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise SolverBusy(f"{self.pending} solves already pending")
+            self.pending += 1
+
+        # pending is released when the worker finishes, not when we stop
+        # waiting, so timed-out solves still count against the limit
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def stats(self):
+        """
+        Pool counters.
+
+        Returns
+        -------
+        dict
+            ``pending``, ``completed``, ``rejected`` and ``timeouts``.
+        """
+        return {
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+    def shutdown(self, wait=True):
+        """
+        Stop the workers, cancelling solves that have not started.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
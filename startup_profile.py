@@ -0,0 +1,78 @@
+"""
+Wall-clock timing of the front end's startup phases.
+
+Workers are started on demand, so a slow cold start is paid by the user who
+triggered it. Each phase of startup is wrapped in ``phase`` and the
+breakdown is printed once the server is up.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# import this module first so the total covers every other import
+STARTED = time.perf_counter()
+
+_phases = {}
+_lock = threading.Lock()
+
+
+@contextmanager
+def phase(name):
+    """
+    Time a block of startup work.
+
+    Only the first run of a phase is kept, so code that NiceGUI re-executes
+    for every client (e.g. building the page) reports its cold cost.
+
+    Parameters
+    ----------
+    name : str
+        Label of the phase in the report.
+    """
+    with _lock:
+        first = name not in _phases
+        if first:
+            # reserve the slot so nested phases are listed after this one
+            _phases[name] = None
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if first:
+            _phases[name] = time.perf_counter() - start
+
+
+def timings():
+    """
+    Seconds spent in each recorded phase.
+
+    Returns
+    -------
+    dict
+        Phase name -> seconds, in the order the phases first started, plus
+        ``total`` since this module was imported. Phases still running are
+        left out.
+    """
+    with _lock:
+        out = {name: seconds for name, seconds in _phases.items() if seconds is not None}
+    out["total"] = time.perf_counter() - STARTED
+    return out
+
+
+def report():
+    """
+    Startup breakdown as printable text.
+
+    Returns
+    -------
+    str
+        One line per phase with its seconds and share of the total.
+    """
+    out = timings()
+    total = out.pop("total")
+    width = max([len(name) for name in out] + [len("total")])
+    lines = [f"startup {total:.3f}s"]
+    for name, seconds in out.items():
+        lines.append(f"  {name:<{width}}  {seconds:7.3f}s  {seconds / total:6.1%}")
+    return "\n".join(lines)
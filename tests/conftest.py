@@ -0,0 +1,18 @@
+import os
+
+import pandas as pd
+import pytest
+
+from solver import compile_catalog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def cards():
+    return pd.read_json(os.path.join(ROOT, "cards_w_score.json"))
+
+
+@pytest.fixture(scope="session")
+def catalog(cards):
+    return compile_catalog(cards[cards["score"] == "Very Good"])
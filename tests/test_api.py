@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from nicegui import app
+
+import api
+import solver
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
+
+def test_negative_spending_is_rejected(client):
+    response = client.post("/api/optimize", json={"spending": {"dining": -5}, "tier": "Very Good"})
+    assert response.status_code == 422
+
+
+def test_failed_solve_is_a_client_error(client, monkeypatch):
+    monkeypatch.setattr(solver, "run_backends", lambda *args: None)
+    # a profile no earlier test has cached
+    response = client.post("/api/optimize", json={"spending": {"dining": 1234.5}, "tier": "Very Good"})
+    assert response.status_code == 422
+
+
+def test_failed_batch_profile_is_a_client_error(client, monkeypatch):
+    failed = pd.DataFrame([(None, 0.0, set(), {}, "milp")], columns=["chosen", "total", "held", "breakdown", "method"])
+    monkeypatch.setattr(api, "optimize_batch", lambda *args: failed)
+    response = client.post("/api/optimize/batch", json={"profiles": [{"spending": {"dining": 100}, "tier": "Very Good"}]})
+    assert response.status_code == 422
@@ -0,0 +1,34 @@
+import os
+
+import pandas as pd
+import pytest
+
+from cleaners import clean_catalog
+from cleaners.bulk import clean_annual_fees, clean_rewards_table, rewards_lists
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("name", ["clean_cards.json", "cards_w_score.json"])
+def test_bulk_matches_per_card_cleaning(name):
+    df = pd.read_json(os.path.join(ROOT, name))
+    # every card twice, as aggregator dumps repeat reward text
+    df = pd.concat([df, df], ignore_index=True)
+    expected = clean_catalog(df, workers=1)
+
+    rewards = clean_rewards_table(df)
+    assert list(clean_annual_fees(df)) == list(expected["clean_annual_fee"])
+    assert [[list(r) for r in rs] for rs in expected["clean_rewards"]] == list(rewards_lists(rewards, df.index))
+
+
+def test_repeated_index_labels_stay_separate_cards():
+    df = pd.read_json(os.path.join(ROOT, "clean_cards.json"))
+    # concatenated without ignore_index, as dumps often are
+    df = pd.concat([df, df.iloc[::-1]])
+    expected = clean_catalog(df, workers=1)
+
+    rewards = clean_rewards_table(df)
+    assert list(clean_annual_fees(df)) == list(expected["clean_annual_fee"])
+    lists = rewards_lists(rewards, df.index)
+    assert lists.index.equals(df.index)
+    assert [[list(r) for r in rs] for rs in expected["clean_rewards"]] == list(lists)
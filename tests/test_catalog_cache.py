@@ -0,0 +1,40 @@
+import os
+import shutil
+
+import pandas as pd
+
+from catalog_cache import TierCatalogCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_replacement_with_an_older_mtime_is_reloaded(tmp_path):
+    path = str(tmp_path / "cards.json")
+    shutil.copy(os.path.join(ROOT, "cards_w_score.json"), path)
+    cache = TierCatalogCache(path)
+    assert len(cache.get("Very Good")) == 54
+    version = cache.version
+
+    # new content carrying an mtime from before the store was built, as cp -p,
+    # rsync -a and tar x leave it
+    df = pd.read_json(path)
+    replacement = str(tmp_path / "replacement.json")
+    df[df["score"] != "Very Good"].to_json(replacement, orient="records")
+    before = os.stat(path).st_mtime_ns - 10**9
+    os.utime(replacement, ns=(before, before))
+    os.replace(replacement, path)
+
+    assert len(cache.get("Very Good")) == 0
+    assert cache.version != version
+    assert cache.reloads == 2
+
+
+def test_unchanged_file_reuses_the_store(tmp_path):
+    path = str(tmp_path / "cards.json")
+    shutil.copy(os.path.join(ROOT, "cards_w_score.json"), path)
+    TierCatalogCache(path)
+    built = os.stat(tmp_path / "cards.npz").st_mtime_ns
+
+    cache = TierCatalogCache(path)
+    assert os.stat(tmp_path / "cards.npz").st_mtime_ns == built
+    assert len(cache.get("Excellent")) == 14
@@ -0,0 +1,48 @@
+import os
+
+import pandas as pd
+import pytest
+
+from cleaners import capital_one_cleaner, cleaner_for, nerdwallet_cleaner
+from cleaners.categories import CATEGORIES, detect_category
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def keyword_scan(clause_lower):
+    # the per-cleaner classifier detect_category replaced
+    for cat, keywords in CATEGORIES.items():
+        if any(k.lower() in clause_lower for k in keywords):
+            return cat
+    return "Other"
+
+
+@pytest.fixture(scope="module")
+def reward_strings():
+    pairs = set()
+    for name in ("clean_cards.json", "cards_w_score.json"):
+        df = pd.read_json(os.path.join(ROOT, name))
+        for issuer, rewards in zip(df["issuer"], df["rewards"]):
+            pairs.update((issuer, r) for r in rewards)
+    return sorted(pairs)
+
+
+@pytest.mark.parametrize("cleaner", [capital_one_cleaner, nerdwallet_cleaner])
+def test_detect_category_matches_keyword_scan(cleaner, reward_strings, monkeypatch):
+    strings = [text for issuer, text in reward_strings if cleaner_for(issuer) is cleaner]
+    assert strings
+    expected = [cleaner.clean_rate(s) for s in strings]
+
+    # the clauses clean_rate classifies, answered by the old scan
+    clauses = []
+
+    def scan(clause_lower):
+        clauses.append(clause_lower)
+        return keyword_scan(clause_lower)
+
+    monkeypatch.setattr(cleaner, "detect_category", scan)
+    assert [cleaner.clean_rate(s) for s in strings] == expected
+    assert clauses
+
+    for text in clauses + [s.lower() for s in strings]:
+        assert detect_category(text) == keyword_scan(text), text
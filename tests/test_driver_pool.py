@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import WebDriverException  # noqa: E402
+
+from scrapers import driver_pool  # noqa: E402
+from scrapers.driver_pool import DriverPool  # noqa: E402
+
+
+class FakeDriver:
+    def __init__(self):
+        self.loads = 0
+        self.quits = 0
+
+    def quit(self):
+        self.quits += 1
+
+
+@pytest.fixture
+def started(monkeypatch):
+    drivers = []
+
+    def chrome(options=None):
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(driver_pool, "webdriver", SimpleNamespace(Chrome=chrome))
+    return drivers
+
+
+def load(driver, url):
+    driver.loads += 1
+    return url
+
+
+def test_driver_is_recycled_after_max_pages(started):
+    with DriverPool(size=1, max_pages=3) as pool:
+        assert [pool.run(load, i) for i in range(7)] == list(range(7))
+        assert [d.loads for d in started] == [3, 3, 1]
+        assert [d.quits for d in started] == [1, 1, 0]
+    assert started[-1].quits == 1
+
+
+def test_crashed_driver_is_replaced(started):
+    def crash_once(driver, url):
+        if len(started) == 1:
+            raise WebDriverException("chrome not reachable")
+        return load(driver, url)
+
+    with DriverPool(size=1) as pool:
+        with pytest.raises(WebDriverException):
+            pool.run(crash_once, "a")
+        assert pool.run(crash_once, "b") == "b"
+    assert len(started) == 2
+    assert started[0].quits == 1
+
+
+def test_failed_start_raises_the_driver_error(monkeypatch):
+    def missing(options=None):
+        raise WebDriverException("chromedriver not found")
+
+    monkeypatch.setattr(driver_pool, "webdriver", SimpleNamespace(Chrome=missing))
+    with DriverPool(size=1) as pool:
+        for _ in range(2):
+            # the slot goes back to the pool, so a retry starts again
+            with pytest.raises(WebDriverException, match="chromedriver"):
+                pool.run(load, "a")
@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import incremental
+from incremental import IncrementalSession
+from solver import compile_catalog, optimize_cardspace
+
+CATEGORIES = ["Travel", "Groceries & Dining", "Gas & Utilities", "Retail & Entertainment", "All Purchases"]
+
+
+def profiles(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{k: float(rng.choice([0, 50, 200, 1000, 3000, 12000])) for k in CATEGORIES} for _ in range(n)]
+
+
+@pytest.fixture
+def milp_only(monkeypatch):
+    # skip the fast path so every solve goes through the session's warm model
+    monkeypatch.setattr(incremental, "run_backends", lambda *args: None)
+
+
+@pytest.mark.parametrize("score", [580, 700])
+def test_warm_cbc_matches_cold_solves(cards, milp_only, score):
+    catalog = compile_catalog(cards[cards["score"] == "Poor"])
+    session = IncrementalSession(backend="cbc")
+    for spending in profiles(12):
+        expected = optimize_cardspace(catalog, None, spending, score, fast_path=False, backend="cbc")[1]
+        assert session.solve(catalog, spending, score)[1] == pytest.approx(expected)
+
+
+def test_concurrent_solves_share_one_session_safely(catalog):
+    session = IncrementalSession()
+    batch = profiles(16, seed=1)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        totals = list(executor.map(lambda spending: session.solve(catalog, spending, 720)[1], batch))
+    assert totals == pytest.approx([optimize_cardspace(catalog, None, spending, 720)[1] for spending in batch])
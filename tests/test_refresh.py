@@ -0,0 +1,61 @@
+import os
+import shutil
+
+import pandas as pd
+
+from refresh import RAW_FIELDS, refresh, refresh_catalog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def scrape_of(path):
+    # the raw fields as scrape_all returns them, Chase without a score
+    scraped = pd.read_json(path)[RAW_FIELDS]
+    scraped["score"] = scraped["score"].astype(object)
+    scraped.loc[scraped["issuer"] == "Chase", "score"] = None
+    return scraped
+
+
+def test_noop_refresh_round_trips_through_the_json(tmp_path):
+    path = str(tmp_path / "cards.json")
+    shutil.copy(os.path.join(ROOT, "cards_w_score.json"), path)
+    scraped = scrape_of(path)
+    mtime = os.stat(path).st_mtime_ns
+
+    for _ in range(2):
+        changelog = refresh(scraped, path, changelog_path=None)
+        assert (changelog["added"], changelog["removed"], changelog["modified"], changelog["tiers"]) == ([], [], [], [])
+    assert os.stat(path).st_mtime_ns == mtime
+
+
+def test_changed_card_keeps_its_tier_and_refreshes_once(tmp_path):
+    path = str(tmp_path / "cards.json")
+    shutil.copy(os.path.join(ROOT, "cards_w_score.json"), path)
+    scraped = scrape_of(path)
+    row = scraped.index[scraped["name"] == "Chase Sapphire Reserve"][0]
+    scraped.at[row, "annual_fee"] = "$895"
+
+    changelog = refresh(scraped, path, changelog_path=None)
+    assert changelog["modified"] == [("Chase", "Chase Sapphire Reserve")]
+    assert changelog["tiers"] == ["Excellent"]
+    written = pd.read_json(path)
+    assert written.loc[row, "score"] == "Excellent"
+    assert written.loc[row, "clean_annual_fee"] == 895
+    assert written["score"].notna().all()
+
+    assert refresh(scraped, path, changelog_path=None)["modified"] == []
+
+
+def test_missing_scores_read_back_as_nan_do_not_break_the_tiers():
+    existing = pd.DataFrame([
+        {"name": "A", "issuer": "X", "annual_fee": "$0", "rewards": ["1% cash back on all purchases"],
+         "score": float("nan"), "clean_annual_fee": 0, "clean_rewards": []},
+        {"name": "B", "issuer": "X", "annual_fee": "$0", "rewards": ["1% cash back on all purchases"],
+         "score": "Good", "clean_annual_fee": 0, "clean_rewards": []},
+    ])
+    scraped = existing[RAW_FIELDS].copy()
+    scraped["annual_fee"] = "$95"
+
+    _, changelog = refresh_catalog(scraped, existing)
+    assert changelog["modified"] == [("X", "A"), ("X", "B")]
+    assert changelog["tiers"] == ["Good"]
@@ -0,0 +1,14 @@
+from result_cache import SolutionCache
+from solver import CardCatalog
+
+
+def test_scores_unlocking_different_cards_get_their_own_entries():
+    catalog = CardCatalog(["Basic", "Premium"], ["dining"], [[0.01], [0.05]], [0, 0], min_scores=[0, 740])
+    cache = SolutionCache()
+
+    assert cache.solve(catalog, {"dining": 1000}, 800, "Good", "v1")[0] == {"dining": "Premium"}
+    assert cache.solve(catalog, {"dining": 1000}, 300, "Good", "v1")[0] == {"dining": "Basic"}
+    # same eligible cards as 800
+    assert cache.solve(catalog, {"dining": 1000}, 760, "Good", "v1")[0] == {"dining": "Premium"}
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["hits"] == 1
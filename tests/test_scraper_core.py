@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from scrapers import chase_scraper, scraper_core
+from scrapers.scraper_core import ResponseCache, fetch_all, request
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "chase")
+
+# product page path -> saved page
+PAGES = {
+    "/all-credit-cards": "all-credit-cards.html",
+    "/cash-back-credit-cards/freedom/unlimited": "unlimited.html",
+    "/rewards-credit-cards/sapphire/preferred": "preferred.html",
+    "/travel-credit-cards/united/explorer": "explorer.html",
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("?")[0]
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            failures = server.failures.get(path, 0)
+            if failures:
+                server.failures[path] = failures - 1
+        try:
+            time.sleep(server.delays.get(path, server.delay))
+            if failures:
+                self.send_response(503)
+                self.end_headers()
+                return
+            if path in PAGES:
+                with open(os.path.join(FIXTURES, PAGES[path]), encoding="utf-8") as f:
+                    body = f.read().replace("{base}", server.base)
+            elif path.startswith("/echo/"):
+                body = path
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.active = 0
+    httpd.max_active = 0
+    httpd.delay = 0.0
+    httpd.delays = {}
+    httpd.failures = {}
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    # never read or write the working directory's response cache
+    monkeypatch.setattr(scraper_core, "response_cache", ResponseCache(str(tmp_path), ttl=None, replay=False))
+
+
+def test_fetch_all_keeps_url_order(server):
+    urls = [f"{server.base}/echo/{i}" for i in range(12)]
+    # later URLs answer first
+    server.delays = {f"/echo/{i}": 0.01 * (12 - i) for i in range(12)}
+    pages = fetch_all(urls, max_per_host=6, progress=False, cache=False)
+    assert pages == [f"/echo/{i}" for i in range(12)]
+
+
+def test_fetch_all_respects_the_per_host_limit(server):
+    server.delay = 0.05
+    urls = [f"{server.base}/echo/{i}" for i in range(12)]
+    pages = fetch_all(urls, max_per_host=3, progress=False, cache=False)
+    assert len(pages) == 12
+    assert 1 < server.max_active <= 3
+
+
+def test_request_retries_with_exponential_backoff(server, monkeypatch):
+    sleeps = []
+    # only the scraper's clock; the fixture server still sleeps for real
+    monkeypatch.setattr(scraper_core, "time", SimpleNamespace(sleep=sleeps.append, time=time.time))
+    server.failures = {"/echo/flaky": 2}
+
+    response = request(f"{server.base}/echo/flaky", retries=3, backoff=0.5)
+    assert response.status_code == 200
+    assert response.text == "/echo/flaky"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_request_returns_the_last_response_when_retries_run_out(server, monkeypatch):
+    sleeps = []
+    # only the scraper's clock; the fixture server still sleeps for real
+    monkeypatch.setattr(scraper_core, "time", SimpleNamespace(sleep=sleeps.append, time=time.time))
+    server.failures = {"/echo/down": 10}
+
+    response = request(f"{server.base}/echo/down", retries=2, backoff=0.1)
+    assert response.status_code == 503
+    assert sleeps == [0.1, 0.2]
+
+
+def test_scrape_chase_from_saved_pages(server, monkeypatch):
+    listing = f"{server.base}/all-credit-cards"
+    monkeypatch.setattr(chase_scraper, "link2soup",
+                        lambda url, parse_only=None: scraper_core.link2soup(listing, parse_only=parse_only))
+    # the product page answering last must still land on its own card
+    server.delays = {"/cash-back-credit-cards/freedom/unlimited": 0.1}
+
+    df = chase_scraper.scrape_chase(max_per_host=3)
+    assert list(df["name"]) == ["Chase Freedom Unlimited", "Chase Sapphire Preferred Card", "United℠ Explorer Card"]
+    assert list(df["annual_fee"]) == ["$0", "$95", "$0 intro for the first year, then $150"]
+    assert df["rewards"][0] == [
+        "5% cash back on travel purchased through Chase Travel℠",
+        "3% cash back on dining at restaurants and drugstores",
+        "1.5% cash back on all other purchases",
+    ]
+    assert df["rewards"][2] == ["2 miles per $1 spent on dining and hotel stays",
+                                "1 mile per $1 spent on all other purchases"]
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from solver import CardCatalog, optimize_cardspace, profile_arrays
+
+
+def wallet_value(catalog, spending, score, held):
+    # the held fee cards plus every free card, each category on its best card
+    cats, values, _ = profile_arrays(catalog, spending)
+    fees = catalog.fees.astype(float)
+    usable = catalog.eligible(score) & ((fees <= 0) | held)
+    best = np.maximum(values[usable].max(axis=0), 0.0) if usable.any() else np.zeros(len(cats))
+    return best.sum() - fees[held & (fees > 0)].sum()
+
+
+def solve(catalog, spending, score):
+    chosen, total, held, breakdown, sensitivity = optimize_cardspace(catalog, None, spending, score,
+                                                                     with_sensitivity=True)
+    return total, np.isin(catalog.names, sorted(held)), sensitivity
+
+
+def test_trigger_card_is_overtaken_by_a_fee_card():
+    # a free card with a 200 bonus from 500 spend, a 95-fee card with a higher rate
+    catalog = CardCatalog(["c0", "c1"], ["groceries"], [[0.03], [0.05]], [0, 95], triggers=[(0, 0, 500, 200)])
+    _, held, sensitivity = solve(catalog, {"groceries": 3000}, 800)
+    assert not held[1]
+    low, high = sensitivity["ranges"]["groceries"]
+    assert low == 500
+    assert high == pytest.approx(14750)
+    assert sensitivity["break_even"]["c1"]["groceries"] == pytest.approx(14750)
+
+
+def test_break_even_beats_every_card_left_in_the_wallet():
+    # at the current spend c0 earns most, but c2 takes over before c1 pays off
+    catalog = CardCatalog(["c0", "c1", "c2"], ["groceries"], [[0.03], [0.05], [0.045]], [0, 95, 0],
+                          triggers=[(0, 0, 500, 200)])
+    _, _, sensitivity = solve(catalog, {"groceries": 3000}, 800)
+    assert sensitivity["break_even"]["c1"]["groceries"] == pytest.approx(19000)
+    assert sensitivity["ranges"]["groceries"][1] == pytest.approx(19000)
+
+
+def random_catalog(rng, n_cards=7, n_cats=3):
+    rates = rng.choice([0.0, 0.01, 0.015, 0.02, 0.03, 0.04, 0.05, 0.06], size=(n_cards, n_cats))
+    fees = rng.choice([0, 0, 95, 250, 550], size=n_cards)
+    triggers = [(int(i), int(j), float(rng.choice([500, 1000, 4000])), float(rng.choice([50, 200, 400])))
+                for i, j in zip(rng.integers(0, n_cards, 3), rng.integers(0, n_cats, 3))]
+    return CardCatalog([f"c{i}" for i in range(n_cards)], [f"k{j}" for j in range(n_cats)], rates, fees,
+                       triggers=triggers)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_ranges_match_re_solves(seed):
+    rng = np.random.default_rng(seed)
+    catalog = random_catalog(rng)
+    spending = {k: float(rng.choice([300, 800, 2000, 6000, 15000])) for k in catalog.categories}
+    _, held, sensitivity = solve(catalog, spending, 800)
+
+    for k, (low, high) in sensitivity["ranges"].items():
+        inside = [low, (low + spending[k]) / 2, spending[k]]
+        inside += [(spending[k] + high) / 2, high] if np.isfinite(high) else [spending[k] * 10]
+        for t in inside:
+            at = {**spending, k: t}
+            # the open end of the range just below a trigger threshold
+            if t == high:
+                at[k] = t - 1e-3
+            total, _, _ = solve(catalog, at, 800)
+            assert wallet_value(catalog, at, 800, held) == pytest.approx(total, abs=1e-4), (k, t)
+
+        thresholds = [min_spend for _, col, min_spend, _ in catalog.triggers if catalog.categories[col] == k]
+        if np.isfinite(high) and high not in thresholds:
+            at = {**spending, k: high * 1.01 + 1}
+            total, _, _ = solve(catalog, at, 800)
+            assert total > wallet_value(catalog, at, 800, held) + 1e-9, k
+        if low > 0 and low not in thresholds:
+            at = {**spending, k: low * 0.99 - 1e-3}
+            total, _, _ = solve(catalog, at, 800)
+            assert total > wallet_value(catalog, at, 800, held) + 1e-9, k
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import solver
+from solver import dominance_mask
+
+
+def dense_dominance_mask(values, fee_vec, profitable=True):
+    keep = values.sum(axis=1) > fee_vec if profitable else np.ones(len(fee_vec), dtype=bool)
+    at_least = (values[:, None, :] >= values[None, :, :]).all(axis=2) & (fee_vec[:, None] <= fee_vec[None, :])
+    strictly = (values[:, None, :] > values[None, :, :]).any(axis=2) | (fee_vec[:, None] < fee_vec[None, :])
+    order = np.arange(len(fee_vec))
+    dominates = at_least & (strictly | (order[:, None] < order[None, :]))
+    return keep & ~dominates.any(axis=0)
+
+
+def test_dominance_mask_blocks_match_dense(monkeypatch):
+    rng = np.random.default_rng(0)
+    # few distinct values so ties and exact duplicates are common
+    values = rng.integers(0, 4, size=(300, 5)).astype(float)
+    fee_vec = rng.integers(0, 3, size=300).astype(float) * 50
+    values[10] = values[3]
+    fee_vec[10] = fee_vec[3]
+
+    monkeypatch.setattr(solver, "DOMINANCE_BLOCK_ELEMENTS", 300 * 5 * 7)
+    for profitable in (True, False):
+        np.testing.assert_array_equal(dominance_mask(values, fee_vec, profitable),
+                                      dense_dominance_mask(values, fee_vec, profitable))
+
+
+def test_empty_cbc_solve_keeps_the_warm_model_usable(catalog):
+    cats = catalog.categories[:3]
+    chosen, total, held, _ = solver.optimize_cardspace(catalog, None, {k: 0.0 for k in cats}, 720,
+                                                       fast_path=False, backend="cbc")
+    assert total == 0.0 and not held and set(chosen.values()) == {None}
+
+    spending = {k: 3000.0 for k in cats}
+    _, total, _, _ = solver.optimize_cardspace(catalog, None, spending, 720, fast_path=False, backend="cbc")
+    assert total == solver.optimize_cardspace(catalog, None, spending, 720)[1]
+
+
+def test_failing_backend_is_timed(catalog, monkeypatch):
+    def fail(*args):
+        raise RuntimeError("solver crashed")
+
+    monkeypatch.setattr(solver.BACKENDS["cbc"], "solve", fail)
+    before = solver.backend_stats()["cbc"]
+    with pytest.raises(RuntimeError):
+        solver.optimize_cardspace(catalog, None, {catalog.categories[0]: 1000.0}, 720,
+                                  fast_path=False, backend="cbc")
+    after = solver.backend_stats()["cbc"]
+    assert after["calls"] == before["calls"] + 1
+    assert after["failed"] == before["failed"] + 1
+    assert after["seconds"] >= before["seconds"]
+
+
+def test_importing_solver_defers_the_solver_libraries():
+    # a fresh interpreter, since this one has already solved with them
+    code = "import sys, solver; print(sorted({'highspy', 'pulp', 'pandas'} & set(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(solver.__file__)),
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_prune_candidates_counts_ineligible_and_dominated_cards():
+    values = np.array([[50.0, 10.0], [40.0, 10.0], [100.0, 0.0], [0.0, 5.0]])
+    fee_vec = np.array([0.0, 0.0, 95.0, 0.0])
+    eligible = np.array([True, True, True, False])
+    allowed, removed = solver.prune_candidates(values, fee_vec, eligible)
+    # card 1 is dominated by card 0, card 3 is ineligible
+    assert list(allowed) == [True, False, True, False]
+    assert removed == 2
+
+
+@pytest.mark.parametrize("tier", ["Very Good", "Excellent", "Fair"])
+def test_fast_path_matches_the_milp_backends(cards, tier):
+    catalog = solver.compile_catalog(cards[cards["score"] == tier])
+    rng = np.random.default_rng(1)
+    cats = catalog.categories
+    milps = ["cbc", "highs"] if solver.HAVE_HIGHSPY else ["cbc"]
+
+    for _ in range(8):
+        picked = rng.choice(cats, size=min(len(cats), int(rng.integers(1, 6))), replace=False)
+        spending = {k: float(rng.choice([0, 500, 2500, 8000, 30000])) for k in picked}
+        solved = solver.backend_stats()["fast"]["solved"]
+        _, total, _, _ = solver.optimize_cardspace(catalog, None, spending, 800, backend="fast")
+        assert solver.backend_stats()["fast"]["solved"] == solved + 1
+        for backend in milps:
+            _, milp_total, _, _ = solver.optimize_cardspace(catalog, None, spending, 800, fast_path=False,
+                                                            backend=backend)
+            assert milp_total == pytest.approx(total, abs=1e-6), (backend, spending)